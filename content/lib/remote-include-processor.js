@@ -1,11 +1,50 @@
+const fs = require('fs')
+const path = require('path')
+
+// Filled by scripts/include_cache.py (run by utilities/lab-build and the link checker)
+const CACHE_DIR = process.env.REMOTE_INCLUDE_CACHE || '.cache/remote-includes'
+const CONFIG_FILE = 'scripts/link-checker-config.json'
+
+// Seconds a cached include is used for, shared with the link checker's remote_includes.ttl
+function cacheTtl () {
+  if (process.env.REMOTE_INCLUDE_TTL) return Number(process.env.REMOTE_INCLUDE_TTL)
+  try {
+    const ttl = JSON.parse(fs.readFileSync(CONFIG_FILE, 'utf8')).remote_includes.ttl
+    if (typeof ttl === 'number') return ttl
+  } catch (e) {}
+  return 3600
+}
+
+const TTL = cacheTtl()
+
+// Cached content of an include, or undefined when it is missing or (unless allowStale) expired
+function readCached (target, allowStale) {
+  try {
+    const index = JSON.parse(fs.readFileSync(path.join(CACHE_DIR, 'index.json'), 'utf8'))
+    const entry = index[target]
+    if (!entry) return undefined
+    if (!allowStale && Date.now() / 1000 - entry.fetched_at >= TTL) return undefined
+    return fs.readFileSync(path.join(CACHE_DIR, 'objects', entry.sha256.slice(0, 2), entry.sha256), 'utf8')
+  } catch (e) {}
+  return undefined
+}
+
 module.exports = function () {
     this.includeProcessor(function () {
       this.$option('position', '>>')
       this.handles((target) => target.startsWith('http'))
       this.process((doc, reader, target, attrs) => {
-        const contents = require('child_process').execFileSync('curl', ['--silent', '-L', target], { encoding: 'utf8' })
+        let contents = readCached(target, false)
+        if (contents === undefined) {
+          try {
+            contents = require('child_process').execFileSync('curl', ['--silent', '-L', target], { encoding: 'utf8' })
+          } catch (e) {
+            // Better a stale copy than a failed build when the server cannot be reached
+            contents = readCached(target, true)
+            if (contents === undefined) throw e
+          }
+        }
         reader.pushInclude(contents, target, target, 1, attrs)
       })
     })
   }
-  
\ No newline at end of file
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Link Checker Anchor Validation
+Streaming, early-exit lookup of URL fragments in the target page's HTML.
+"""
+
+import codecs
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import unquote, urlsplit
+
+import requests
+
+from request_timing import current_timing
+
+@dataclass
+class PageAnchors:
+    """Anchors found on one page so far."""
+    anchors: Set[str] = field(default_factory=set)
+    complete: bool = False  # The whole page was parsed
+    usable: bool = True  # False when the page could not be fetched or is not HTML
+
+class AnchorParser(HTMLParser):
+    """Incremental parser collecting ``id`` and ``name`` attributes.
+
+    ``done`` turns true as soon as every wanted anchor has been seen, so
+    the caller can stop feeding the rest of the page.
+    """
+
+    def __init__(self, wanted: Set[str]):
+        super().__init__(convert_charrefs=True)
+        self.anchors: Set[str] = set()
+        self.missing = set(wanted)
+
+    def handle_starttag(self, tag: str, attrs: List) -> None:
+        for name, value in attrs:
+            if name in ('id', 'name') and value:
+                self.anchors.add(value)
+                self.missing.discard(value)
+
+    handle_startendtag = handle_starttag
+
+    @property
+    def done(self) -> bool:
+        return not self.missing
+
+def page_and_fragment(url: str) -> tuple:
+    """Split a URL into the page URL and its decoded fragment."""
+    page, _, fragment = url.partition('#')
+    return page, unquote(fragment)
+
+class AnchorIndex:
+    """Per-run cache of page anchors shared by all fragment URLs of a page.
+
+    ``plan`` registers every fragment the run will ask about, so the first
+    lookup on a page streams it only until all of them have turned up and
+    later lookups are answered from memory. A per-page lock makes
+    concurrent lookups for the same page wait for that single download.
+
+    The index makes no requests itself: each lookup gets the caller's open,
+    streamed response for the page and only reads its body if needed.
+    """
+
+    def __init__(self, max_bytes: int = 5 * 1024 * 1024, ignore_patterns: Optional[List[str]] = None,
+                 chunk_size: int = 16384):
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.ignore = [re.compile(pattern) for pattern in (ignore_patterns or [])]
+        self._lock = threading.Lock()
+        self._page_locks: Dict[str, threading.Lock] = {}
+        self._pages: Dict[str, PageAnchors] = {}
+        self._wanted: Dict[str, Set[str]] = {}
+        self.pages_fetched = 0
+
+    def applies(self, url: str) -> bool:
+        """Whether the URL has a fragment that should be looked up in the page."""
+        fragment = urlsplit(url).fragment
+        return bool(fragment) and not any(pattern.search(fragment) for pattern in self.ignore)
+
+    def plan(self, urls: Iterable[str]) -> None:
+        """Start a new run that will look up the fragments of these URLs."""
+        wanted: Dict[str, Set[str]] = {}
+        for url in urls:
+            if self.applies(url):
+                page, fragment = page_and_fragment(url)
+                wanted.setdefault(page, set()).add(fragment)
+        with self._lock:
+            self._wanted = wanted
+            self._pages = {}
+            self._page_locks = {}
+            self.pages_fetched = 0
+
+    def has_anchor(self, url: str, response: requests.Response,
+                   deadline: Optional[float] = None) -> Optional[bool]:
+        """Return whether the URL's fragment exists on its page, or None if that cannot be told.
+
+        ``response`` is a streamed GET of the URL; its body is read only when
+        the page has not been scanned far enough yet, and never past
+        ``deadline`` (a ``time.monotonic()`` value).
+        """
+        page_url, fragment = page_and_fragment(url)
+        with self._lock:
+            page_lock = self._page_locks.setdefault(page_url, threading.Lock())
+
+        with page_lock:
+            page = self._pages.get(page_url)
+            if page is None or (page.usable and not page.complete and fragment not in page.anchors):
+                # First lookup, or a fragment the plan did not know about
+                wanted = self._wanted.get(page_url, set()) | {fragment}
+                page = self._scan(response, wanted, deadline)
+                self._pages[page_url] = page
+
+        if fragment in page.anchors:
+            return True
+        if not page.usable or not page.complete:
+            return None
+        return False
+
+    def _scan(self, response: requests.Response, wanted: Set[str], deadline: Optional[float]) -> PageAnchors:
+        """Stream a page through the parser until every wanted anchor is found."""
+        timing = current_timing()
+        try:
+            content_type = response.headers.get('Content-Type', '')
+            if response.status_code >= 400 or 'html' not in content_type.lower():
+                return PageAnchors(usable=False)
+
+            charset = re.search(r'charset=([\w-]+)', content_type)
+            try:
+                decoder = codecs.getincrementaldecoder(charset.group(1) if charset else 'utf-8')(errors='replace')
+            except LookupError:
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            parser = AnchorParser(wanted)
+            received = 0
+            complete = True
+            start = time.perf_counter()
+            try:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    received += len(chunk)
+                    parser.feed(decoder.decode(chunk))
+                    if parser.done:
+                        complete = False
+                        break
+                    if received >= self.max_bytes:
+                        complete = False
+                        break
+                    if deadline is not None and time.monotonic() >= deadline:
+                        complete = False
+                        break
+                else:
+                    parser.feed(decoder.decode(b'', final=True))
+                    parser.close()
+            except requests.exceptions.RequestException:
+                complete = False
+            finally:
+                if timing is not None:
+                    timing.transfer += time.perf_counter() - start
+                    timing.approx_bytes += received
+            with self._lock:
+                self.pages_fetched += 1
+            return PageAnchors(anchors=parser.anchors, complete=complete)
+        finally:
+            response.close()
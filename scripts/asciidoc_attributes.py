@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - AsciiDoc Attribute Substitution
+Expands {attribute} references from antora.yml and page attribute entries
+so links built from attributes can be extracted and checked.
+"""
+
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from content_discovery import load_component_descriptor
+
+# An attribute entry (``:name: value``, ``:name!:``) or an attribute reference (``{name}``)
+ATTRIBUTE_ENTRY = r"^:(?P<unset>!?)(?P<name>\w[\w-]*)(?P<unset_after>!?):(?:[ \t]+(?P<value>.*?))?[ \t]*$"
+ATTRIBUTE_REFERENCE = r"(?P<escape>\\)?\{(?P<ref>\w[\w-]*)\}"
+ENTRY_OR_REFERENCE = re.compile(f"{ATTRIBUTE_ENTRY}|{ATTRIBUTE_REFERENCE}", re.MULTILINE)
+REFERENCE = re.compile(ATTRIBUTE_REFERENCE)
+
+def expand_value(value: str, attributes: Dict[str, str]) -> str:
+    """Replace the references to known attributes in a single value."""
+    def replace(match):
+        name = match.group('ref').lower()
+        if match.group('escape') or name not in attributes:
+            return match.group(0)
+        return attributes[name]
+    return REFERENCE.sub(replace, value)
+
+def unresolved_reference(value: str) -> Optional[str]:
+    """Name of the first attribute reference left in a value after expansion, if any."""
+    for match in REFERENCE.finditer(value):
+        if not match.group('escape'):
+            return match.group('ref')
+    return None
+
+@lru_cache(maxsize=None)
+def component_attributes(descriptor: str) -> Dict[str, str]:
+    """Attributes declared under ``asciidoc.attributes`` in a component descriptor, resolved once.
+
+    Values may refer to attributes declared before them. Antora's soft-set
+    ``@`` suffix is dropped and ``false``/``null`` values unset the attribute.
+    """
+    declared = (load_component_descriptor(descriptor).get('asciidoc') or {}).get('attributes') or {}
+    attributes: Dict[str, str] = {}
+    for name, value in declared.items():
+        name = str(name).lower()
+        if value is False or value is None:
+            attributes.pop(name, None)
+            continue
+        value = '' if value is True else str(value)
+        if value.endswith('@'):
+            value = value[:-1]
+        attributes[name] = expand_value(value, attributes)
+    return attributes
+
+class AttributeResolver:
+    """Attribute tables of the Antora components and their pages.
+
+    A page starts from its component's table, resolved once per run, and
+    attribute entries in the page apply from the line that defines them
+    on, as in Asciidoctor. Files outside a component only see their own
+    entries. Content without a ``{`` is returned untouched, so expansion
+    costs nothing for the common case.
+    """
+
+    def __init__(self, descriptors: List[str]):
+        self.components: List[Tuple[Path, str]] = [
+            (Path(descriptor).parent.resolve(), descriptor)
+            for descriptor in descriptors if Path(descriptor).is_file()
+        ]
+
+    def base_attributes(self, file_path: str) -> Dict[str, str]:
+        """The attributes a file inherits from its component."""
+        path = Path(file_path).resolve()
+        for root, descriptor in self.components:
+            if root in path.parents:
+                return dict(component_attributes(descriptor))
+        return {}
+
+    def page_attributes(self, content: str, file_path: str) -> Dict[str, str]:
+        """All attributes defined for a file once every entry in it has been applied."""
+        attributes = self.base_attributes(file_path)
+        self._apply(content, attributes)
+        return attributes
+
+    @staticmethod
+    def _apply(content: str, attributes: Dict[str, str],
+               spans: Optional[List[Tuple[int, int, int, int]]] = None) -> str:
+        """Expand references in document order, updating the table at each entry.
+
+        When ``spans`` is given, every replacement is recorded in it as
+        (expanded start, expanded end, original start, original end).
+        """
+        parts = []
+        position = 0
+        shift = 0
+
+        def substitute(match) -> None:
+            nonlocal position, shift
+            name = match.group('ref').lower()
+            if match.group('escape') or name not in attributes:
+                return
+            value = attributes[name]
+            parts.append(content[position:match.start()])
+            parts.append(value)
+            if spans is not None:
+                start = match.start() + shift
+                spans.append((start, start + len(value), match.start(), match.end()))
+            shift += len(value) - (match.end() - match.start())
+            position = match.end()
+
+        for match in ENTRY_OR_REFERENCE.finditer(content):
+            if not match.group('name'):
+                substitute(match)
+                continue
+            # The value of an entry is expanded with the attributes defined before it
+            if match.group('value'):
+                for reference in REFERENCE.finditer(content, match.start('value'), match.end('value')):
+                    substitute(reference)
+            name = match.group('name').lower()
+            if match.group('unset') or match.group('unset_after'):
+                attributes.pop(name, None)
+            else:
+                attributes[name] = expand_value(match.group('value') or '', attributes)
+        parts.append(content[position:])
+        return ''.join(parts)
+
+    def expand(self, content: str, file_path: str) -> Tuple[str, "OffsetMap"]:
+        """Expand the attribute references of a document.
+
+        Returns the expanded text and a map from its offsets back to the
+        original content, so link locations still point into the source.
+        """
+        if '{' not in content:
+            return content, OffsetMap([])
+        spans: List[Tuple[int, int, int, int]] = []
+        expanded = self._apply(content, self.base_attributes(file_path), spans)
+        return expanded, OffsetMap(spans)
+
+class OffsetMap:
+    """Maps offsets in expanded text back to the original text."""
+
+    def __init__(self, spans: List[Tuple[int, int, int, int]]):
+        self.spans = spans
+        self._starts = [span[0] for span in spans]
+
+    def original(self, offset: int) -> int:
+        """Original offset of an expanded one; text from an attribute maps to its reference."""
+        index = bisect_right(self._starts, offset) - 1
+        if index < 0:
+            return offset
+        expanded_start, expanded_end, original_start, original_end = self.spans[index]
+        if offset < expanded_end:
+            return original_start
+        return offset - expanded_end + original_end
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Link Checker Benchmark
+Offline throughput benchmark against a local, scriptable stand-in HTTP server.
+
+The server answers synthetic URLs whose first path segment selects a
+behaviour (slow responses, redirect chains, 429 storms with Retry-After,
+servers without HEAD support, huge bodies, connection resets). Synthetic
+.adoc corpora are generated for each requested size and checked both
+in-process with LinkChecker.check_modules and end-to-end through the
+link_checker.py command line, each run in a process of its own so peak
+RSS is measured per scenario. No internet access is needed.
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from link_checker import LinkChecker
+
+# Share of generated links per server behaviour
+DEFAULT_MIX = {
+    "ok": 0.70,
+    "slow": 0.05,
+    "redirect": 0.05,
+    "throttle": 0.05,
+    "nohead": 0.05,
+    "huge": 0.03,
+    "reset": 0.02,
+    "missing": 0.05
+}
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Request handler whose behaviour is chosen by the first path segment."""
+
+    protocol_version = "HTTP/1.1"
+    server: "StandInServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, headers: Dict[str, str] = None, body: bytes = b"") -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self._write(body)
+
+    def _write(self, data: bytes) -> None:
+        try:
+            self.wfile.write(data)
+            self.server.count_bytes(len(data))
+        except (BrokenPipeError, ConnectionResetError):
+            # The checker closes streamed GETs after the headers arrive
+            self.close_connection = True
+
+    def _handle(self) -> None:
+        options = self.server.options
+        parts = self.path.strip("/").split("/")
+        kind = parts[0]
+
+        if kind == "slow":
+            time.sleep(options["slow_delay"])
+        elif kind == "redirect":
+            hops = int(parts[1]) if len(parts) > 2 else options["redirect_hops"]
+            if hops > 0:
+                target = "/redirect/" + str(hops - 1) + "/" + "/".join(parts[2:] or parts[1:])
+                self._send(301, {"Location": target})
+                return
+        elif kind == "throttle":
+            hits = self.server.count_hit(self.path)
+            if hits <= options["throttle_hits"]:
+                self._send(429, {"Retry-After": str(options["retry_after"])})
+                return
+        elif kind == "nohead" and self.command == "HEAD":
+            self._send(405)
+            return
+        elif kind == "huge":
+            self.send_response(200)
+            self.send_header("Content-Length", str(options["huge_bytes"]))
+            self.end_headers()
+            if self.command != "HEAD":
+                chunk = b"x" * 65536
+                remaining = options["huge_bytes"]
+                while remaining > 0 and not self.close_connection:
+                    self._write(chunk[:remaining])
+                    remaining -= len(chunk)
+            return
+        elif kind == "reset":
+            self.close_connection = True
+            # Zero linger turns the close into a TCP reset
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+            self.connection.close()
+            return
+        elif kind == "missing":
+            self._send(404, body=b"not found")
+            return
+
+        self._send(200, {"Content-Type": "text/html"}, b"<html><body>ok</body></html>")
+
+    def do_GET(self):
+        self._handle()
+
+    def do_HEAD(self):
+        self._handle()
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded local server that counts hits per path and bytes sent."""
+
+    daemon_threads = True
+
+    def __init__(self, address, options: Dict):
+        super().__init__(address, StandInHandler)
+        self.options = options
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self.bytes_sent = 0
+
+    def count_hit(self, path: str) -> int:
+        with self._lock:
+            self._hits[path] = self._hits.get(path, 0) + 1
+            return self._hits[path]
+
+    def count_bytes(self, count: int) -> None:
+        with self._lock:
+            self.bytes_sent += count
+
+    def handle_error(self, request, client_address) -> None:
+        # Resets and early closes are part of the simulation, not server errors
+        pass
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self._hits.clear()
+            self.bytes_sent = 0
+
+def start_servers(host_count: int, options: Dict) -> List[StandInServer]:
+    """Start one server per loopback address to simulate independent hosts."""
+    servers = []
+    for index in range(host_count):
+        address = f"127.0.0.{index + 1}"
+        try:
+            server = StandInServer((address, 0), options)
+        except OSError:
+            # Platforms without the full 127.0.0.0/8 loopback range
+            if servers:
+                break
+            raise
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+def generate_corpus(directory: Path, link_count: int, servers: List[StandInServer],
+                    mix: Dict[str, float], files: int, seed: int) -> List[str]:
+    """Write synthetic module pages containing link_count links in total."""
+    rng = random.Random(seed)
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    bases = [f"http://{server.server_address[0]}:{server.server_address[1]}" for server in servers]
+
+    pages: List[List[str]] = [[] for _ in range(files)]
+    for index in range(link_count):
+        kind = rng.choices(kinds, weights)[0]
+        url = f"{bases[index % len(bases)]}/{kind}/page-{index}"
+        line = f"See link:{url}[reference {index}] for details." if index % 2 else f"Bare link {url} here."
+        pages[index % files].append(line)
+
+    paths = []
+    for number, lines in enumerate(pages, 1):
+        path = directory / f"module-{number:02d}-benchmark.adoc"
+        path.write_text(f"= Benchmark Module {number}\n\n" + "\n\n".join(lines) + "\n", encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+def write_config(directory: Path, args: argparse.Namespace) -> str:
+    """Write a checker configuration tuned for the local server."""
+    config = {
+        "settings": {
+            "timeout": args.timeout,
+            "max_redirects": 5,
+            "delay_between_checks": 0,
+            "max_workers": args.workers,
+            "per_host_concurrency": args.per_host_concurrency,
+            "user_agent": "OpenShift-Workshop-LinkChecker-Benchmark/1.0"
+        },
+        "skip_patterns": [],
+        "skip_reasons": {},
+        "rate_limit": {"requests_per_second": args.rate, "burst": args.rate, "max_backoff": 5},
+        "retry": {"enabled": True, "max_attempts": 3, "delay": 0.1},
+        "cache": {"enabled": False},
+        "output": {
+            "log_file": str(directory / "link-check.log"),
+            "issue_file": str(directory / "issue.md"),
+            "verbose": False,
+            "colors": False
+        }
+    }
+    path = directory / "config.json"
+    path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    return str(path)
+
+def peak_rss_mb(maxrss: int) -> float:
+    """Peak resident set size in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+def run_measured(command: List[str]) -> Tuple[int, float, float, bytes]:
+    """Run a command, returning its exit code, wall time, peak RSS in MB and stdout.
+
+    The peak RSS is read from the child's own rusage with ``os.wait4``;
+    ``RUSAGE_CHILDREN`` would report the largest peak of any earlier child.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    output = process.stdout.read()
+    process.stdout.close()
+    _, status, usage = os.wait4(process.pid, 0)
+    wall_time = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, wall_time, peak_rss_mb(usage.ru_maxrss), output
+
+def check_modules_in_process(config_file: str, files: List[str]) -> None:
+    """Run LinkChecker.check_modules and print its wall time and failures as JSON."""
+    logging.getLogger('LinkChecker').handlers.clear()
+    checker = LinkChecker(config_file)
+    checker.logger.setLevel(logging.CRITICAL)
+
+    start = time.perf_counter()
+    results = checker.check_modules(files)
+    wall_time = time.perf_counter() - start
+    print(json.dumps({"wall_time": wall_time, "failed": sum(result.failed_links for result in results)}))
+
+def bench_check_modules(config_file: str, files: List[str], link_count: int,
+                        servers: List[StandInServer]) -> Dict:
+    """Benchmark LinkChecker.check_modules in a fresh process of its own.
+
+    The wall time is measured around ``check_modules`` only, so it excludes
+    interpreter startup; the peak RSS is that of the process.
+    """
+    for server in servers:
+        server.reset_counters()
+
+    _, _, peak_rss, output = run_measured(
+        [sys.executable, str(Path(__file__).resolve()), "--check-modules-in-process", config_file, *files]
+    )
+    measured = json.loads(output)
+
+    return {
+        "scenario": "check_modules",
+        "links": link_count,
+        "wall_time": measured["wall_time"],
+        "urls_per_sec": link_count / measured["wall_time"] if measured["wall_time"] else 0.0,
+        "bytes": sum(server.bytes_sent for server in servers),
+        "peak_rss_mb": peak_rss,
+        "failed": measured["failed"]
+    }
+
+def bench_main(config_file: str, files: List[str], link_count: int,
+               servers: List[StandInServer]) -> Dict:
+    """Benchmark the full link_checker.py pipeline in a subprocess."""
+    for server in servers:
+        server.reset_counters()
+
+    exit_code, wall_time, peak_rss, _ = run_measured(
+        [sys.executable, str(SCRIPTS_DIR / "link_checker.py"), "--config", config_file, *files]
+    )
+
+    return {
+        "scenario": "main",
+        "links": link_count,
+        "wall_time": wall_time,
+        "urls_per_sec": link_count / wall_time if wall_time else 0.0,
+        "bytes": sum(server.bytes_sent for server in servers),
+        "peak_rss_mb": peak_rss,
+        "exit_code": exit_code
+    }
+
+def all_pass_startup(script: str, scenario: str):
+    """Build a runner timing a full CLI run on a corpus where every link passes.
+
+    Comparing ``startup_basic`` with ``startup_ai`` shows what the
+    intelligent checker costs when no AI analysis is needed.
+    """
+    def run(config_file: str, files: List[str], link_count: int, servers: List[StandInServer]) -> Dict:
+        corpus_dir = Path(config_file).parent / "all-pass"
+        corpus_dir.mkdir(exist_ok=True)
+        all_pass_files = generate_corpus(corpus_dir, link_count, servers, {"ok": 1.0}, len(files), seed=0)
+        for server in servers:
+            server.reset_counters()
+
+        exit_code, wall_time, peak_rss, _ = run_measured(
+            [sys.executable, str(SCRIPTS_DIR / script), "--config", config_file, *all_pass_files]
+        )
+
+        return {
+            "scenario": scenario,
+            "links": link_count,
+            "wall_time": wall_time,
+            "urls_per_sec": link_count / wall_time if wall_time else 0.0,
+            "bytes": sum(server.bytes_sent for server in servers),
+            "peak_rss_mb": peak_rss,
+            "exit_code": exit_code
+        }
+    return run
+
+def main():
+    """Main function with command line interface."""
+    parser = argparse.ArgumentParser(description='Offline benchmark for the OpenShift Workshop Link Checker')
+    parser.add_argument('--sizes', default='100,1000',
+                       help='Comma-separated corpus sizes in links (e.g. 100,1000,10000)')
+    parser.add_argument('--scenarios', default='check_modules,main,startup_basic,startup_ai',
+                       help='Comma-separated scenarios to run: check_modules, main, startup_basic, startup_ai')
+    parser.add_argument('--files', type=int, default=7, help='Number of module pages per corpus')
+    parser.add_argument('--hosts', type=int, default=4, help='Number of simulated hosts')
+    parser.add_argument('--workers', type=int, default=16, help='Concurrent checks')
+    parser.add_argument('--per-host-concurrency', type=int, default=4, help='Concurrent requests per host')
+    parser.add_argument('--rate', type=float, default=500, help='Allowed requests per second per host')
+    parser.add_argument('--timeout', type=float, default=5, help='Request timeout in seconds')
+    parser.add_argument('--slow-delay', type=float, default=0.2, help='Delay of /slow responses in seconds')
+    parser.add_argument('--redirect-hops', type=int, default=3, help='Hops in each redirect chain')
+    parser.add_argument('--throttle-hits', type=int, default=1, help='429 responses before /throttle succeeds')
+    parser.add_argument('--retry-after', type=int, default=0, help='Retry-After seconds sent with 429s')
+    parser.add_argument('--huge-bytes', type=int, default=5 * 1024 * 1024, help='Body size of /huge responses')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for corpus generation')
+    parser.add_argument('--json', metavar='FILE', help='Also write the results as JSON')
+    parser.add_argument('--check-modules-in-process', nargs='+', metavar='ARG', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+    if args.check_modules_in_process:
+        # Child of the check_modules scenario: CONFIG FILE...
+        config_file, *files = args.check_modules_in_process
+        check_modules_in_process(config_file, files)
+        return
+
+    options = {
+        "slow_delay": args.slow_delay,
+        "redirect_hops": args.redirect_hops,
+        "throttle_hits": args.throttle_hits,
+        "retry_after": args.retry_after,
+        "huge_bytes": args.huge_bytes
+    }
+    servers = start_servers(args.hosts, options)
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    runners = {
+        "check_modules": bench_check_modules,
+        "main": bench_main,
+        "startup_basic": all_pass_startup("link_checker.py", "startup_basic"),
+        "startup_ai": all_pass_startup("intelligent_link_checker.py", "startup_ai")
+    }
+
+    results = []
+    print(f"{'scenario':<14} {'links':>7} {'wall (s)':>9} {'URLs/s':>9} {'bytes':>12} {'peak RSS (MB)':>14}")
+    with tempfile.TemporaryDirectory(prefix="link-checker-bench-") as temp_dir:
+        for size in (int(s) for s in args.sizes.split(',')):
+            corpus_dir = Path(temp_dir) / f"corpus-{size}"
+            corpus_dir.mkdir()
+            files = generate_corpus(corpus_dir, size, servers, DEFAULT_MIX, args.files, args.seed)
+            config_file = write_config(corpus_dir, args)
+
+            for scenario in scenarios:
+                result = runners[scenario](config_file, files, size, servers)
+                results.append(result)
+                print(f"{result['scenario']:<14} {result['links']:>7} {result['wall_time']:>9.2f} "
+                      f"{result['urls_per_sec']:>9.1f} {result['bytes']:>12} {result['peak_rss_mb']:>14.1f}")
+
+    for server in servers:
+        server.shutdown()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
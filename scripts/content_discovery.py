@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Content Discovery
+Builds the set of files to check from the config and the Antora component descriptors.
+"""
+
+import os
+from fnmatch import fnmatch
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Set
+
+import yaml
+
+@lru_cache(maxsize=None)
+def load_component_descriptor(path: str) -> Dict:
+    """Parse an Antora component descriptor (``antora.yml``), once per run."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f) or {}
+
+class ContentDiscovery:
+    """Yield every file the link checker should look at, each exactly once.
+
+    Files come from three places, in this order:
+
+    - each Antora component in ``antora.components``: its descriptor (for
+      ``page-links``), the nav files it lists and every file under its
+      ``modules/`` folder (pages, partials, examples, nav and assets)
+    - every file under the ``directories`` entries
+    - the ``files`` entries
+
+    Each tree is walked once with ``os.walk``; hidden folders and paths
+    matching a ``discovery.exclude`` glob are pruned. Only files whose
+    extension ``handles`` accepts are yielded, so images and other binaries
+    are never read. Files are yielded as they are found, so extraction can
+    start before the walk has finished.
+    """
+
+    def __init__(self, config: Dict, handles: Callable[[str], bool]):
+        self.descriptors: List[str] = config.get('antora', {}).get('components', [])
+        self.directories: List[str] = config.get('directories', [])
+        self.files: List[str] = config.get('files', [])
+        self.exclude: List[str] = config.get('discovery', {}).get('exclude', [])
+        self.handles = handles
+
+    def _excluded(self, path: Path) -> bool:
+        posix = path.as_posix()
+        return any(fnmatch(posix, pattern) for pattern in self.exclude)
+
+    def _walk(self, root: Path, seen: Set[Path]) -> Iterator[str]:
+        """Yield the handled files below a folder in a stable order."""
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(name for name in dirnames
+                                 if not name.startswith('.') and not self._excluded(Path(directory) / name))
+            for filename in sorted(filenames):
+                path = Path(directory) / filename
+                if self.handles(filename) and not self._excluded(path) and self._claim(path, seen):
+                    yield str(path)
+
+    @staticmethod
+    def _claim(path: Path, seen: Set[Path]) -> bool:
+        """Record a file as yielded, returning False if it already was."""
+        resolved = path.resolve()
+        if resolved in seen:
+            return False
+        seen.add(resolved)
+        return True
+
+    def discover(self) -> Iterator[str]:
+        """Yield the paths of all files to check."""
+        seen: Set[Path] = set()
+        for descriptor in self.descriptors:
+            path = Path(descriptor)
+            if not path.is_file():
+                continue
+            if self._claim(path, seen):
+                yield str(path)
+            for nav in load_component_descriptor(str(path)).get('nav') or []:
+                nav_path = path.parent / nav
+                if nav_path.is_file() and self._claim(nav_path, seen):
+                    yield str(nav_path)
+            yield from self._walk(path.parent / 'modules', seen)
+
+        for directory in self.directories:
+            yield from self._walk(Path(directory), seen)
+
+        for file_path in self.files:
+            path = Path(file_path)
+            if path.is_file() and not self._excluded(path) and self._claim(path, seen):
+                yield str(path)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - GitHub Issue Client
+Pooled GitHub REST client that keeps a single link checker issue up to date.
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_API_URL = "https://api.github.com"
+
+class GitHubError(Exception):
+    """A GitHub API request failed."""
+
+class GitHubClient:
+    """Minimal GitHub issues client over one pooled session that retries reads and edits.
+
+    The ``X-RateLimit-*`` headers of every response are recorded in
+    ``rate_limit``. Once the quota is exhausted, requests wait for the reset
+    if it is at most ``max_rate_limit_wait`` seconds away and fail otherwise.
+    ``api_url`` can point at GitHub Enterprise or a local mock of the API.
+    """
+
+    def __init__(self, token: str, repo: str, api_url: str = DEFAULT_API_URL,
+                 timeout: int = 30, max_rate_limit_wait: int = 60):
+        self.repo = repo
+        self.api_url = api_url.rstrip('/')
+        self.timeout = timeout
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.rate_limit: Dict[str, int] = {}
+        self.logger = logging.getLogger(__name__)
+
+        self.session = requests.Session()
+        # POST is not retried: GitHub may have created the issue before answering
+        # with a 5xx, and a retry would open a duplicate. Repeating a PATCH is harmless.
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET", "PATCH"]
+        )
+        self.session.mount("https://", HTTPAdapter(max_retries=retry_strategy))
+        self.session.mount("http://", HTTPAdapter(max_retries=retry_strategy))
+        self.session.headers.update({
+            'Authorization': f'token {token}',
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'OpenShift-Workshop-Link-Checker/1.0'
+        })
+
+    def _wait_for_quota(self) -> None:
+        """Block until the rate limit resets, or fail if that is too far away."""
+        if self.rate_limit.get('remaining', 1) > 0:
+            return
+        wait = self.rate_limit.get('reset', 0) - time.time()
+        if wait <= 0:
+            return
+        if wait > self.max_rate_limit_wait:
+            raise GitHubError(f"GitHub API rate limit exhausted, resets in {int(wait)}s")
+        self.logger.warning(f"⏳ GitHub API rate limit exhausted, waiting {int(wait)}s for reset")
+        time.sleep(wait)
+
+    def _record_rate_limit(self, response: requests.Response) -> None:
+        for key in ('limit', 'remaining', 'reset', 'used'):
+            value = response.headers.get(f'X-RateLimit-{key.capitalize()}')
+            if value is not None and value.isdigit():
+                self.rate_limit[key] = int(value)
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send an API request relative to ``api_url`` and raise on errors."""
+        self._wait_for_quota()
+        response = self.session.request(method, f"{self.api_url}{path}", timeout=self.timeout, **kwargs)
+        self._record_rate_limit(response)
+        if response.status_code >= 400:
+            raise GitHubError(f"{method} {path} failed: {response.status_code} - {response.text}")
+        return response
+
+    def find_open_issue(self, label: str, marker: str) -> Optional[Dict]:
+        """Find the open issue carrying ``label``, or failing that one whose body contains ``marker``."""
+        issues = self.request('GET', f"/repos/{self.repo}/issues",
+                              params={'state': 'open', 'labels': label, 'per_page': 100}).json()
+        issues = [issue for issue in issues if 'pull_request' not in issue]
+        for issue in issues:
+            if marker in (issue.get('body') or ''):
+                return issue
+        if issues:
+            return issues[0]
+
+        # The label may have been removed by hand; fall back to the body marker
+        # Search ignores punctuation, so match on the marker text alone
+        query = f'repo:{self.repo} is:issue is:open in:body "{marker.strip("<!-> ")}"'
+        found = self.request('GET', "/search/issues", params={'q': query, 'per_page': 1}).json()
+        items = found.get('items', [])
+        return items[0] if items else None
+
+    def create_issue(self, title: str, body: str, labels: List[str]) -> Dict:
+        """Open a new issue."""
+        return self.request('POST', f"/repos/{self.repo}/issues",
+                            json={'title': title, 'body': body, 'labels': labels}).json()
+
+    def update_issue(self, number: int, **fields) -> Dict:
+        """Edit an existing issue in place."""
+        return self.request('PATCH', f"/repos/{self.repo}/issues/{number}", json=fields).json()
+
+    def upsert_issue(self, title: str, body: str, labels: List[str], marker: str,
+                     fingerprint: Optional[str] = None) -> Tuple[Dict, str]:
+        """Update the open link checker issue, or create it if there is none.
+
+        ``labels[0]`` identifies the issue. Returns the issue and what
+        happened: 'created', 'updated' or 'unchanged' when the open issue
+        already reports ``fingerprint``.
+        """
+        issue = self.find_open_issue(labels[0], marker)
+        if issue is None:
+            return self.create_issue(title, body, labels), 'created'
+        if fingerprint and fingerprint in (issue.get('body') or ''):
+            return issue, 'unchanged'
+        return self.update_issue(issue['number'], title=title, body=body), 'updated'
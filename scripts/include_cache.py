@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Remote Include Cache
+Concurrent fetching of remote include:: targets into a content-addressed
+on-disk cache shared by the link checker and local site builds.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from asciidoc_attributes import AttributeResolver
+from content_discovery import ContentDiscovery
+from link_extractor import LinkExtractor
+
+REMOTE_INCLUDE = re.compile(r"^include::(https?://[^\[\s]+)\[", re.MULTILINE)
+DEFAULT_CACHE_DIR = ".cache/remote-includes"
+
+def find_remote_includes(content: str) -> List[str]:
+    """Remote include targets of a document, in order and without duplicates."""
+    return list(dict.fromkeys(match.group(1) for match in REMOTE_INCLUDE.finditer(content)))
+
+@dataclass
+class CachedInclude:
+    """Index entry for one remote include URL."""
+    sha256: str  # Object holding the content
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float  # Last download or successful revalidation
+
+class IncludeCache:
+    """Content-addressed cache of remote include content.
+
+    Each distinct content is stored once as ``objects/<sha[:2]>/<sha256>``
+    and ``index.json`` maps every URL to its object together with the
+    ``ETag``/``Last-Modified`` it was served with. Entries younger than
+    ``ttl`` seconds are used without a request; older ones are revalidated
+    with a conditional GET. The layout is plain files, so the Antora
+    remote include processor reads it without any Python involved.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, ttl: int = 3600):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._index: Dict[str, CachedInclude] = {}
+        index_file = self.directory / 'index.json'
+        if index_file.is_file():
+            try:
+                with open(index_file, 'r', encoding='utf-8') as f:
+                    self._index = {url: CachedInclude(**entry) for url, entry in json.load(f).items()}
+            except (ValueError, TypeError):
+                # A damaged index only costs a fresh download of every include
+                self._index = {}
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.directory / 'objects' / sha256[:2] / sha256
+
+    def get(self, url: str) -> Optional[CachedInclude]:
+        """Return the entry for a URL if its content is still on disk."""
+        with self._lock:
+            entry = self._index.get(url)
+        if entry and self._object_path(entry.sha256).is_file():
+            return entry
+        return None
+
+    def is_fresh(self, entry: CachedInclude) -> bool:
+        return time.time() - entry.fetched_at < self.ttl
+
+    def read(self, entry: CachedInclude) -> str:
+        return self._object_path(entry.sha256).read_bytes().decode('utf-8', errors='replace')
+
+    def store(self, url: str, content: bytes, etag: Optional[str], last_modified: Optional[str]) -> CachedInclude:
+        """Store downloaded content and point the URL at it."""
+        sha256 = hashlib.sha256(content).hexdigest()
+        path = self._object_path(sha256)
+        if not path.is_file():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{sha256}.{threading.get_ident()}.tmp")
+            temp_path.write_bytes(content)
+            os.replace(temp_path, path)
+        entry = CachedInclude(sha256, etag, last_modified, time.time())
+        with self._lock:
+            self._index[url] = entry
+        return entry
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as revalidated (the server answered 304 Not Modified)."""
+        with self._lock:
+            if url in self._index:
+                self._index[url].fetched_at = time.time()
+
+    def save(self) -> None:
+        """Write the index in one step so concurrent readers never see a partial file."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        index_file = self.directory / 'index.json'
+        temp_path = index_file.with_suffix('.json.tmp')
+        with self._lock:
+            index = {url: asdict(entry) for url, entry in sorted(self._index.items())}
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+        os.replace(temp_path, index_file)
+
+class RemoteIncludeFetcher:
+    """Fetch remote includes concurrently through the cache, following nested includes.
+
+    ``get`` performs a GET with the given extra headers; the link checker
+    passes one that goes through its pooled, rate-limited session.
+    """
+
+    def __init__(self, get: Callable[[str, Dict[str, str]], requests.Response], cache: IncludeCache,
+                 max_workers: int = 8, max_depth: int = 3, logger: Optional[logging.Logger] = None):
+        self.get = get
+        self.cache = cache
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+        self.logger = logger or logging.getLogger(__name__)
+        self.stats = {'fresh': 0, 'revalidated': 0, 'downloaded': 0, 'stale': 0, 'failed': 0}
+        self.changed: Set[str] = set()  # Includes whose content differs from the copy cached before
+        self._stats_lock = threading.Lock()
+
+    def _count(self, outcome: str, changed: Optional[str] = None) -> None:
+        with self._stats_lock:
+            self.stats[outcome] += 1
+            if changed is not None:
+                self.changed.add(changed)
+
+    def fetch(self, url: str) -> Optional[str]:
+        """Return the content of a remote include, or None if it cannot be had."""
+        entry = self.cache.get(url)
+        if entry and self.cache.is_fresh(entry):
+            self._count('fresh')
+            return self.cache.read(entry)
+
+        headers = {}
+        if entry and entry.etag:
+            headers['If-None-Match'] = entry.etag
+        elif entry and entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        try:
+            response = self.get(url, headers)
+            try:
+                if response.status_code == 304 and entry:
+                    self.cache.touch(url)
+                    self._count('revalidated')
+                    return self.cache.read(entry)
+                response.raise_for_status()
+                previous = entry.sha256 if entry else None
+                entry = self.cache.store(url, response.content, response.headers.get('ETag'),
+                                         response.headers.get('Last-Modified'))
+            finally:
+                response.close()
+        except requests.exceptions.RequestException as e:
+            if entry:
+                # Better a stale copy than losing the include's links altogether
+                self.logger.warning(f"Using cached copy of {url}: {e}")
+                self._count('stale')
+                return self.cache.read(entry)
+            self.logger.warning(f"Could not fetch remote include {url}: {e}")
+            self._count('failed')
+            return None
+        self._count('downloaded', url if entry.sha256 != previous else None)
+        return self.cache.read(entry)
+
+    def resolve(self, urls: Iterable[str]) -> Tuple[Dict[str, Optional[str]], Dict[str, List[str]]]:
+        """Fetch the includes and, level by level, the remote includes inside them.
+
+        Returns the content of every include reached (None when it could
+        not be fetched) and the remote includes each of them contains.
+        """
+        contents: Dict[str, Optional[str]] = {}
+        children: Dict[str, List[str]] = {}
+        level = list(dict.fromkeys(urls))
+        depth = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while level and depth < self.max_depth:
+                for url, content in zip(level, executor.map(self.fetch, level)):
+                    contents[url] = content
+                    children[url] = find_remote_includes(content) if content else []
+                level = [child for url in level for child in children[url] if child not in contents]
+                level = list(dict.fromkeys(level))
+                depth += 1
+        self.cache.save()
+        return contents, children
+
+def included_closure(roots: List[str], children: Dict[str, List[str]]) -> List[str]:
+    """Every include reachable from ``roots``, in first-seen order."""
+    seen: Dict[str, None] = {}
+    pending = list(roots)
+    while pending:
+        url = pending.pop(0)
+        if url in seen:
+            continue
+        seen[url] = None
+        pending.extend(children.get(url, []))
+    return list(seen)
+
+def main():
+    """Warm the cache with the remote includes of the content, e.g. before a local site build."""
+    parser = argparse.ArgumentParser(description='Prefetch remote include:: targets into the include cache')
+    parser.add_argument('files', nargs='*', help='Files to scan (default: discovered from the config)')
+    parser.add_argument('--config', default='scripts/link-checker-config.json',
+                       help='Configuration file path')
+    parser.add_argument('--cache-dir', help='Include cache directory (overrides config)')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    with open(args.config, 'r') as f:
+        config = json.load(f)
+    include_config = config.get('remote_includes', {})
+    cache = IncludeCache(args.cache_dir or include_config.get('cache_dir', DEFAULT_CACHE_DIR),
+                         include_config.get('ttl', 3600))
+
+    session = requests.Session()
+    workers = include_config.get('max_workers', 8)
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers['User-Agent'] = config['settings']['user_agent']
+    timeout = config['settings'].get('timeout', 30)
+    fetcher = RemoteIncludeFetcher(lambda url, headers: session.get(url, headers=headers, timeout=timeout),
+                                   cache, workers, include_config.get('max_depth', 3))
+
+    files = args.files or ContentDiscovery(config, LinkExtractor(config.get('file_patterns')).handles).discover()
+    attributes = AttributeResolver(config.get('antora', {}).get('components', []))
+    roots = []
+    for file_path in files:
+        if Path(file_path).suffix.lower() == '.adoc':
+            content, _ = attributes.expand(Path(file_path).read_text(encoding='utf-8'), file_path)
+            roots.extend(find_remote_includes(content))
+
+    start = time.perf_counter()
+    contents, _ = fetcher.resolve(roots)
+    stats = ', '.join(f"{count} {outcome}" for outcome, count in fetcher.stats.items() if count)
+    logging.info(f"📥 {len(contents)} remote includes cached in {cache.directory} "
+                 f"in {time.perf_counter() - start:.2f}s ({stats or 'none found'})")
+    sys.exit(1 if fetcher.stats['failed'] else 0)
+
+if __name__ == "__main__":
+    main()
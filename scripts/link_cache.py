@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Link Checker Result Cache
+Persistent SQLite caches of link verdicts and replacement searches shared
+between link checker runs.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_TTLS = {
+    "PASS": 86400,
+    "FAIL": 0,
+    "ERROR": 0
+}
+
+@dataclass
+class CacheEntry:
+    """A cached verdict for a single URL."""
+    url: str
+    status: str
+    status_code: Optional[int]
+    final_url: Optional[str]
+    error_message: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    checked_at: float
+    redirects: Optional[str] = None  # JSON list of redirect hops
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for use as a cache key.
+
+    Scheme and host are lower-cased and default ports dropped; path, query
+    and fragment are kept as written since servers may treat them
+    case-sensitively.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, parts.fragment))
+
+class SQLiteStore:
+    """Base class for the caches kept in the shared SQLite file.
+
+    The database is a single self-contained file so CI can save and restore
+    it between runs. All access goes through one connection guarded by a
+    lock, which keeps it safe to use from the concurrent check workers.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+class LinkCache(SQLiteStore):
+    """SQLite-backed verdict cache with per-status TTLs."""
+
+    def __init__(self, path: str, ttls: Optional[Dict[str, int]] = None):
+        super().__init__(path)
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS link_results (
+                url TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                status_code INTEGER,
+                final_url TEXT,
+                error_message TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                checked_at REAL NOT NULL,
+                redirects TEXT
+            )"""
+        )
+        # Caches written before redirect chains were recorded lack the column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(link_results)")}
+        if 'redirects' not in columns:
+            self._conn.execute("ALTER TABLE link_results ADD COLUMN redirects TEXT")
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached entry for a URL, fresh or not."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, status_code, final_url, error_message, etag, last_modified, checked_at, "
+                "redirects FROM link_results WHERE url = ?",
+                (normalize_url(url),)
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Check whether an entry is still within the TTL for its status."""
+        ttl = self.ttls.get(entry.status, 0)
+        return ttl > 0 and time.time() - entry.checked_at < ttl
+
+    def put(self, url: str, status: str, status_code: Optional[int], final_url: Optional[str] = None,
+            error_message: Optional[str] = None, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, redirects: Optional[List[Dict]] = None) -> None:
+        """Store the verdict for a URL, replacing any previous entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO link_results "
+                "(url, status, status_code, final_url, error_message, etag, last_modified, checked_at, redirects) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), status, status_code, final_url, error_message,
+                 etag, last_modified, time.time(), json.dumps(redirects) if redirects else None)
+            )
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as freshly validated (e.g. after a 304 Not Modified)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE link_results SET checked_at = ? WHERE url = ?",
+                (time.time(), normalize_url(url))
+            )
+            self._conn.commit()
+
+class SearchCache(SQLiteStore):
+    """Cache of web-search results and validated replacement URLs.
+
+    Search results are keyed by query, replacements by the normalized broken
+    URL. A replacement entry with no replacement records that nothing was
+    found, and expires after the (shorter) negative TTL.
+    """
+
+    def __init__(self, path: str, search_ttl: int = 604800, replacement_ttl: int = 2592000,
+                 negative_ttl: int = 86400):
+        super().__init__(path)
+        self.search_ttl = search_ttl
+        self.replacement_ttl = replacement_ttl
+        self.negative_ttl = negative_ttl
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS search_results (
+                query TEXT PRIMARY KEY,
+                raw_results TEXT NOT NULL,
+                candidates TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS replacements (
+                broken_url TEXT PRIMARY KEY,
+                replacement TEXT,
+                found_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    def get_search(self, query: str) -> Optional[Tuple[str, List[Tuple[str, str]]]]:
+        """Return cached (raw results, parsed candidates) for a query, if fresh."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT raw_results, candidates, fetched_at FROM search_results WHERE query = ?",
+                (query,)
+            ).fetchone()
+        if not row or time.time() - row[2] >= self.search_ttl:
+            return None
+        return row[0], [tuple(candidate) for candidate in json.loads(row[1])]
+
+    def put_search(self, query: str, raw_results: str, candidates: List[Tuple[str, str]]) -> None:
+        """Store the raw results and parsed candidates of a query."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_results (query, raw_results, candidates, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (query, raw_results, json.dumps(candidates), time.time())
+            )
+            self._conn.commit()
+
+    def get_replacement(self, broken_url: str) -> Tuple[bool, Optional[Dict]]:
+        """Return (found, replacement) for a broken URL.
+
+        ``found`` is False when there is no fresh entry. A fresh entry with a
+        ``None`` replacement means a recent search found nothing.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT replacement, found_at FROM replacements WHERE broken_url = ?",
+                (normalize_url(broken_url),)
+            ).fetchone()
+        if not row:
+            return False, None
+        ttl = self.replacement_ttl if row[0] else self.negative_ttl
+        if time.time() - row[1] >= ttl:
+            return False, None
+        return True, json.loads(row[0]) if row[0] else None
+
+    def put_replacement(self, broken_url: str, replacement: Optional[Dict]) -> None:
+        """Store a validated replacement, or None when nothing was found."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO replacements (broken_url, replacement, found_at) VALUES (?, ?, ?)",
+                (normalize_url(broken_url), json.dumps(replacement) if replacement else None, time.time())
+            )
+            self._conn.commit()
+
+    def forget_replacement(self, broken_url: str) -> None:
+        """Drop a cached replacement that no longer works."""
+        with self._lock:
+            self._conn.execute("DELETE FROM replacements WHERE broken_url = ?", (normalize_url(broken_url),))
+            self._conn.commit()
+
+class AnalysisCache(SQLiteStore):
+    """Stored AI analyses keyed by a fingerprint of the failures they describe.
+
+    Every distinct set of failures adds a row, so analyses older than the TTL
+    are ignored on read and deleted when the cache is opened.
+    """
+
+    def __init__(self, path: str, ttl: int = 2592000):
+        super().__init__(path)
+        self.ttl = ttl
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS ai_analyses (
+                fingerprint TEXT PRIMARY KEY,
+                analysis TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("DELETE FROM ai_analyses WHERE created_at <= ?", (time.time() - ttl,))
+        self._conn.commit()
+
+    def get(self, fingerprint: str) -> Optional[Dict]:
+        """Return the stored analysis for a fingerprint, if fresh."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT analysis, created_at FROM ai_analyses WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+        if not row or time.time() - row[1] >= self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def put(self, fingerprint: str, analysis: Dict) -> None:
+        """Store an analysis under its fingerprint."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_analyses (fingerprint, analysis, created_at) VALUES (?, ?, ?)",
+                (fingerprint, json.dumps(analysis), time.time())
+            )
+            self._conn.commit()
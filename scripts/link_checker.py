@@ -9,24 +9,65 @@ import re
 import sys
 import time
 import argparse
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Optional
+from urllib.parse import urlparse
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import logging
 
+from anchor_checker import AnchorIndex
+from asciidoc_attributes import AttributeResolver, unresolved_reference
+from content_discovery import ContentDiscovery
+from include_cache import DEFAULT_CACHE_DIR, IncludeCache, RemoteIncludeFetcher, find_remote_includes, included_closure
+from link_cache import CacheEntry, LinkCache
+from link_extractor import LinkExtractor, LinkOccurrence
+from result_sinks import JsonLinesSink, JUnitSink, ResultSink, SarifSink
+from skip_rules import SkipMatcher
+from xref_index import ContentIndex
+from rate_limiter import HostRateLimiter, parse_retry_after
+from redirect_rewriter import permanent_target, write_redirect_patch
+from request_timing import RequestTiming, TimingHTTPAdapter, current_timing, host_percentiles, measure
+
+class BudgetExhausted(Exception):
+    """The run's time budget ran out before a check could complete."""
+
+@dataclass
+class RedirectHop:
+    """One redirect response on the way to a URL's final target."""
+    url: str  # URL that answered with the redirect
+    status_code: int
+    elapsed: float  # Seconds until the redirect response headers arrived
+
 @dataclass
 class LinkResult:
     """Data class for link validation results."""
     url: str
     status_code: Optional[int]
-    status: str  # 'PASS', 'FAIL', 'SKIP', 'ERROR'
+    status: str  # 'PASS', 'FAIL', 'SKIP', 'ERROR', 'DEFERRED' (not checked within the run's limits)
     response_time: float
     error_message: Optional[str] = None
     final_url: Optional[str] = None  # After redirects
+    referenced_by: List[str] = field(default_factory=list)  # Modules linking to this URL
+    cache_status: Optional[str] = None  # 'HIT', 'REVALIDATED' or 'STORED' when served from the cache
+    method: Optional[str] = None  # HTTP method that produced the verdict ('HEAD' or 'GET')
+    redirects: List[RedirectHop] = field(default_factory=list)  # Redirect chain, in order
+    timing: Optional[RequestTiming] = None  # Network timing breakdown of a live check
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LinkResult":
+        """Rebuild a result serialized with ``asdict``."""
+        data = dict(data)
+        data['redirects'] = [RedirectHop(**hop) for hop in data.get('redirects', [])]
+        if data.get('timing'):
+            data['timing'] = RequestTiming(**data['timing'])
+        return cls(**data)
 
 @dataclass
 class ModuleResult:
@@ -39,15 +80,40 @@ class ModuleResult:
     skipped_links: int
     links: List[LinkResult]
     processing_time: float
+    locations: Dict[str, List[str]] = field(default_factory=dict)  # URL -> ["path:line:column", ...]
+    deferred_links: int = 0
 
 class LinkChecker:
     """Main link checker class with JSON configuration support."""
     
+    # Status codes from servers that do not implement HEAD properly
+    HEAD_REJECTED_CODES = (403, 405, 501)
+    # Status codes that mean the host wants us to slow down
+    THROTTLE_CODES = (429, 503)
+    
     def __init__(self, config_file: str = "scripts/link-checker-config.json"):
         """Initialize the link checker with configuration."""
         self.config = self._load_config(config_file)
+        self.max_workers = max(1, self.config['settings'].get('max_workers', 1))
+        retry_config = self.config.get('retry', {})
+        self.retry_attempts = max(1, retry_config.get('max_attempts', 3)) if retry_config.get('enabled', False) else 1
+        self.retry_delay = retry_config.get('delay', 5)
+        self.throttle = HostRateLimiter.from_config(self.config)
         self.session = self._create_session()
+        # Requests shortened by the time budget must end by the deadline, so they are not retried
+        self.final_session = self._create_session(retries=0)
         self.logger = self._setup_logging()
+        self.cache = self._open_cache(self.config.get('cache', {}))
+        self.extractor = LinkExtractor(self.config.get('file_patterns'),
+                                       AttributeResolver(self.config.get('antora', {}).get('components', [])))
+        self.skip_matcher = SkipMatcher(self.config['skip_patterns'], self.config['skip_reasons'])
+        self._head_unsupported = set()
+        self.sinks: List[ResultSink] = []
+        self.time_budget: Optional[float] = self.config['settings'].get('time_budget')
+        self.fail_fast = False
+        self.anchor_index = self._create_anchor_index(self.config.get('anchors', {}))
+        self.include_fetcher = self._create_include_fetcher(self.config.get('remote_includes', {}))
+        self._unchanged_include_links: set = set()  # Links in remote includes whose content did not change
         
     def _load_config(self, config_file: str) -> Dict:
         """Load configuration from JSON file."""
@@ -61,6 +127,8 @@ class LinkChecker:
                     "timeout": 30,
                     "max_redirects": 5,
                     "delay_between_checks": 1,
+                    "max_workers": 8,
+                    "per_host_concurrency": 2,
                     "user_agent": "Mozilla/5.0 (compatible; OpenShift-Workshop-LinkChecker/1.0)"
                 },
                 "skip_patterns": [
@@ -78,6 +146,15 @@ class LinkChecker:
                         ]
                     }
                 },
+                "rate_limit": {
+                    "requests_per_second": 2,
+                    "burst": 2
+                },
+                "retry": {
+                    "enabled": True,
+                    "max_attempts": 3,
+                    "delay": 5
+                },
                 "output": {
                     "log_file": "link-check.log",
                     "issue_file": "issue.md",
@@ -86,18 +163,25 @@ class LinkChecker:
                 }
             }
     
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry strategy."""
+    def _create_session(self, retries: Optional[int] = None) -> requests.Session:
+        """Create a requests session with retry strategy (``retries`` overrides the config)."""
         session = requests.Session()
         
-        # Configure retry strategy
+        # Configure retry strategy for transient server errors; throttling
+        # responses (429/503) are retried by check_url via the rate limiter
         retry_strategy = Retry(
-            total=3,
+            total=self.retry_attempts - 1 if retries is None else retries,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 504],
+            respect_retry_after_header=False,
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the connection pool so concurrent workers don't discard connections
+        adapter = TimingHTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -113,6 +197,42 @@ class LinkChecker:
         
         return session
     
+    def _open_cache(self, cache_config: Dict) -> Optional[LinkCache]:
+        """Open the persistent result cache if it is enabled in the configuration."""
+        if not cache_config.get('enabled', False):
+            return None
+        try:
+            return LinkCache(cache_config.get('path', '.link-checker-cache.sqlite'), cache_config.get('ttl'))
+        except Exception as e:
+            self.logger.warning(f"Result cache disabled, could not open it: {e}")
+            return None
+    
+    def set_cache(self, path: Optional[str]) -> None:
+        """Use a different cache file, or disable caching when path is None."""
+        if self.cache:
+            self.cache.close()
+        cache_config = dict(self.config.get('cache', {}))
+        cache_config.update({'enabled': path is not None, 'path': path})
+        self.cache = self._open_cache(cache_config)
+    
+    def add_sink(self, sink: ResultSink) -> None:
+        """Stream every completed link result to a sink."""
+        self.sinks.append(sink)
+    
+    def close_sinks(self) -> None:
+        """Flush and close all result sinks."""
+        for sink in self.sinks:
+            sink.close()
+        self.sinks = []
+    
+    def set_workers(self, workers: int) -> None:
+        """Change the number of concurrent workers and resize the connection pool."""
+        self.max_workers = max(1, workers)
+        self.session = self._create_session()
+        self.final_session = self._create_session(retries=0)
+        if self.include_fetcher:
+            self.include_fetcher.max_workers = self.max_workers
+    
     def _setup_logging(self) -> logging.Logger:
         """Set up logging configuration."""
         logger = logging.getLogger('LinkChecker')
@@ -137,42 +257,33 @@ class LinkChecker:
         
         return logger
     
-    def extract_links_from_file(self, file_path: str) -> List[str]:
-        """Extract links from an AsciiDoc file."""
+    def extract_occurrences(self, file_path: str) -> List[LinkOccurrence]:
+        """Extract every link occurrence, with its line and column, from a file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            return self.extractor.extract_file(file_path)
         except Exception as e:
             self.logger.error(f"Error reading file {file_path}: {e}")
             return []
-        
-        links = set()
-        
-        # Extract AsciiDoc link:URL[text] format
-        link_pattern = r"link:(https?://[^[]+)\["
-        for match in re.finditer(link_pattern, content):
-            links.add(match.group(1))
-        
-        # Extract bare URLs
-        url_pattern = r"(https?://[^\s\[\]<>()]+)"
-        for match in re.finditer(url_pattern, content):
-            url = match.group(1)
-            # Skip if it's already captured by link: pattern
-            if not re.search(r"link:" + re.escape(url), content):
-                links.add(url)
-        
-        return sorted(list(links))
+    
+    def extract_links_from_file(self, file_path: str) -> List[str]:
+        """Extract the unique links from a file, sorted."""
+        return sorted({occurrence.url for occurrence in self.extract_occurrences(file_path)})
     
     def should_skip_url(self, url: str) -> Tuple[bool, Optional[str]]:
         """Check if URL should be skipped based on patterns."""
-        for pattern in self.config['skip_patterns']:
-            if re.search(pattern, url):
-                reason = self.config['skip_reasons'].get(pattern, "configured to skip")
-                return True, reason
-        return False, None
-    
-    def check_url(self, url: str) -> LinkResult:
-        """Check a single URL and return result."""
+        # A reference expansion left in place points at no real page
+        attribute = unresolved_reference(url)
+        if attribute:
+            return True, f"URL uses undefined document attribute {{{attribute}}}"
+        return self.skip_matcher.should_skip(url)
+    
+    def check_url(self, url: str, deadline: Optional[float] = None) -> LinkResult:
+        """Check a single URL and return result.
+        
+        ``deadline`` is a ``time.monotonic()`` value bounding the check. A URL
+        whose request could not start before it, or whose request was cut
+        short by it, is returned as DEFERRED rather than failed.
+        """
         start_time = time.time()
         
         # Check if URL should be skipped
@@ -186,12 +297,67 @@ class LinkChecker:
                 error_message=skip_reason
             )
         
+        # Serve fresh verdicts straight from the cache
+        cached = self.cache.get(url) if self.cache else None
+        if cached and self.cache.is_fresh(cached):
+            return self._result_from_cache(url, cached, start_time, 'HIT')
+        
+        # Revalidate expired passing entries with a conditional request
+        headers = {}
+        if cached and cached.status == 'PASS':
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+        
+        response = None
+        timing = None
+        shortened = False
         try:
-            response = self.session.get(
-                url,
-                timeout=self.config['settings']['timeout'],
-                allow_redirects=True
-            )
+            host = urlparse(url).netloc.lower()
+            # Fragment links are fetched with a streamed GET whose body the anchor index reads
+            anchored = self.anchor_index is not None and self.anchor_index.applies(url)
+            fetch = self._fetch_page if anchored else self._probe
+            with measure() as timing:
+                for attempt in range(1, self.retry_attempts + 1):
+                    with self._host_slot(host):
+                        # Waiting for the host's slot may have used up the budget
+                        if deadline is not None and time.monotonic() >= deadline:
+                            raise BudgetExhausted("time budget exhausted before the request started")
+                        timeout, shortened = self._request_timeout(deadline)
+                        response, method = fetch(url, headers, timeout,
+                                                 self.final_session if shortened else self.session)
+                    if response.status_code not in self.THROTTLE_CODES:
+                        self.throttle.reward(host)
+                        break
+                    response.close()
+                    
+                    # Back off the whole host, honoring Retry-After when present
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    delay = self.throttle.penalize(
+                        host, retry_after if retry_after is not None else self.retry_delay * 2 ** (attempt - 1)
+                    )
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                    if attempt < self.retry_attempts:
+                        timing.retries += 1
+                        self.logger.warning(f"⏳ {host} returned HTTP {response.status_code}, "
+                                            f"backing off {delay:.1f}s (attempt {attempt}/{self.retry_attempts})")
+                
+                # A page that loads can still have lost the section the link points to
+                anchor_found = None
+                if anchored:
+                    try:
+                        if 200 <= response.status_code < 300:
+                            anchor_found = self.anchor_index.has_anchor(url, response, deadline)
+                    finally:
+                        response.close()
+            
+            if response.status_code == 304 and headers:
+                self.cache.touch(url)
+                result = self._result_from_cache(url, cached, start_time, 'REVALIDATED')
+                result.timing = timing
+                return result
             
             response_time = time.time() - start_time
             
@@ -201,44 +367,328 @@ class LinkChecker:
             else:
                 status = 'FAIL'
                 error_message = f"HTTP {response.status_code}"
+            if anchor_found is False:
+                status = 'FAIL'
+                error_message = f"Anchor #{urlparse(url).fragment} not found"
             
-            return LinkResult(
+            result = LinkResult(
                 url=url,
                 status_code=response.status_code,
                 status=status,
                 response_time=response_time,
                 error_message=error_message,
-                final_url=response.url if response.url != url else None
+                final_url=response.url if response.url != url else None,
+                method=method,
+                redirects=[
+                    RedirectHop(url=hop.url, status_code=hop.status_code, elapsed=hop.elapsed.total_seconds())
+                    for hop in response.history
+                ]
             )
             
-        except requests.exceptions.Timeout:
-            return LinkResult(
+        except BudgetExhausted as e:
+            return self._deferred_result(url, str(e))
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            if shortened and time.monotonic() >= deadline:
+                # The request only timed out because the budget shortened its timeout
+                return self._deferred_result(url, "time budget exhausted during the request")
+            timed_out = isinstance(e, requests.exceptions.Timeout)
+            result = LinkResult(
                 url=url,
                 status_code=None,
                 status='FAIL',
                 response_time=time.time() - start_time,
-                error_message="Request timeout"
-            )
-        except requests.exceptions.ConnectionError:
-            return LinkResult(
-                url=url,
-                status_code=None,
-                status='FAIL',
-                response_time=time.time() - start_time,
-                error_message="Connection error"
+                error_message="Request timeout" if timed_out else "Connection error"
             )
         except Exception as e:
-            return LinkResult(
+            result = LinkResult(
                 url=url,
                 status_code=None,
                 status='ERROR',
                 response_time=time.time() - start_time,
                 error_message=str(e)
             )
+        
+        result.timing = timing
+        if self.cache:
+            self.cache.put(
+                url, result.status, result.status_code, result.final_url, result.error_message,
+                etag=response.headers.get('ETag') if response is not None else None,
+                last_modified=response.headers.get('Last-Modified') if response is not None else None,
+                redirects=[asdict(hop) for hop in result.redirects]
+            )
+        return result
+    
+    def _create_anchor_index(self, anchor_config: Dict) -> Optional[AnchorIndex]:
+        """Set up fragment validation if it is enabled in the configuration."""
+        if not anchor_config.get('enabled', False):
+            return None
+        return AnchorIndex(
+            max_bytes=anchor_config.get('max_bytes', 5 * 1024 * 1024),
+            ignore_patterns=anchor_config.get('ignore_fragments', [])
+        )
+    
+    def _fetch_page(self, url: str, headers: Dict[str, str], timeout: float,
+                    session: requests.Session) -> Tuple[requests.Response, str]:
+        """Start a streamed GET of a page whose anchors are validated, in place of the probe.
+        
+        Its status line gives the verdict, and the caller hands the open
+        response to the anchor index, so the page is requested only once.
+        """
+        response = session.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+        timing = current_timing()
+        if timing is not None:
+            timing.record_response(response)
+        return response, 'GET'
+    
+    def _probe_method(self, host: str) -> str:
+        """Return the configured probe method ('HEAD' or 'GET') for a host."""
+        if host in self._head_unsupported:
+            return 'GET'
+        probing = self.config.get('probing', {})
+        method = probing.get('host_methods', {}).get(host, probing.get('default_method', 'HEAD'))
+        return method.upper()
+    
+    @contextmanager
+    def _host_slot(self, host: str) -> Iterator[None]:
+        """Hold one of the host's throttle slots, counting the wait as queue time of the current check."""
+        start = time.perf_counter()
+        with self.throttle.slot(host):
+            timing = current_timing()
+            if timing is not None:
+                timing.queue += time.perf_counter() - start
+            yield
+    
+    def _request_timeout(self, deadline: Optional[float]) -> Tuple[float, bool]:
+        """Timeout for a request starting now, and whether ``deadline`` shortened it."""
+        timeout = self.config['settings']['timeout']
+        if deadline is None or deadline - time.monotonic() >= timeout:
+            return timeout, False
+        # Never let a single request run far past the run's deadline
+        return max(1.0, deadline - time.monotonic()), True
+    
+    def _deferred_result(self, url: str, reason: str) -> LinkResult:
+        """Result for a URL that could not be checked within the run's limits."""
+        return LinkResult(url=url, status_code=None, status='DEFERRED',
+                          response_time=0.0, error_message=f"Not checked: {reason}")
+    
+    def _probe(self, url: str, headers: Dict[str, str], timeout: float,
+               session: requests.Session) -> Tuple[requests.Response, str]:
+        """Fetch the status of a URL without downloading its body.
+        
+        HEAD is tried first; hosts that reject it (405/403/501) fall back to a
+        streamed GET whose connection is closed as soon as the headers arrive,
+        and are remembered so later URLs on the same host go straight to GET.
+        """
+        host = urlparse(url).netloc.lower()
+        timing = current_timing()
+        if self._probe_method(host) == 'HEAD':
+            response = session.head(url, headers=headers, timeout=timeout, allow_redirects=True)
+            if timing is not None:
+                timing.record_response(response)
+            if response.status_code not in self.HEAD_REJECTED_CODES:
+                return response, 'HEAD'
+            response.close()
+            # A 403 may be specific to this URL; 405/501 mean the server lacks HEAD
+            if response.status_code != 403:
+                self._head_unsupported.add(host)
+        
+        response = session.get(url, headers=headers, timeout=timeout,
+                               allow_redirects=True, stream=True)
+        if timing is not None:
+            timing.record_response(response)
+        # Only the status line and headers are needed; drop the body unread
+        response.close()
+        return response, 'GET'
+    
+    def _result_from_cache(self, url: str, entry: CacheEntry, start_time: float,
+                           cache_status: str) -> LinkResult:
+        """Build a LinkResult from a cached verdict."""
+        return LinkResult(
+            url=url,
+            status_code=entry.status_code,
+            status=entry.status,
+            response_time=time.time() - start_time,
+            error_message=entry.error_message,
+            final_url=entry.final_url,
+            cache_status=cache_status,
+            redirects=[RedirectHop(**hop) for hop in json.loads(entry.redirects or '[]')]
+        )
+    
+    def _log_result(self, result: LinkResult, prefix: str = "") -> None:
+        """Log the outcome of a single link check."""
+        url = result.url
+        if result.status == 'PASS':
+            method = f", {result.method}" if result.method else ""
+            hops = f", {len(result.redirects)} redirect(s)" if result.redirects else ""
+            self.logger.info(f"{prefix}✅ PASS: {url} ({result.response_time:.2f}s{method}{hops})")
+        elif result.status == 'SKIP':
+            self.logger.info(f"{prefix}⚠️ SKIP: {url} - {result.error_message}")
+        elif result.status == 'FAIL':
+            self.logger.error(f"{prefix}❌ FAIL: {url} - {result.error_message}")
+        else:
+            self.logger.error(f"{prefix}🔥 ERROR: {url} - {result.error_message}")
+    
+    def check_urls(self, urls: List[str],
+                   on_result: Optional[Callable[[LinkResult], None]] = None,
+                   deadline: Optional[float] = None, fail_fast: bool = False) -> List[LinkResult]:
+        """Check a list of URLs, returning results in the same order as the input.
+        
+        With ``max_workers`` above 1 the URLs are checked concurrently and
+        politeness comes from the per-host throttle; otherwise they are checked
+        one at a time with ``delay_between_checks`` between requests.
+        ``on_result`` is called with each result as soon as it completes.
+        
+        URLs are started in input order. Once ``deadline`` (a
+        ``time.monotonic()`` value) has passed, or with ``fail_fast`` after
+        the first failure, URLs not yet started are returned as DEFERRED.
+        """
+        total = len(urls)
+        stop_reason: Optional[str] = None
+        
+        def next_result(url: str) -> LinkResult:
+            nonlocal stop_reason
+            if stop_reason is None and deadline is not None and time.monotonic() >= deadline:
+                stop_reason = "time budget exhausted"
+            if stop_reason:
+                return self._deferred_result(url, stop_reason)
+            result = self.check_url(url, deadline)
+            if result.status == 'DEFERRED' and stop_reason is None:
+                stop_reason = "time budget exhausted"
+            if fail_fast and result.status == 'FAIL' and stop_reason is None:
+                stop_reason = "stopped after the first failure (fail-fast)"
+                self.logger.warning(f"🛑 Fail-fast: stopping after {url}")
+            return result
+        
+        try:
+            if self.max_workers <= 1:
+                results = []
+                for i, url in enumerate(urls, 1):
+                    if not stop_reason:
+                        self.logger.info(f"[{i}/{total}] Checking: {url}")
+                    result = next_result(url)
+                    if result.status != 'DEFERRED':
+                        self._log_result(result)
+                    if on_result:
+                        on_result(result)
+                    results.append(result)
+                    
+                    # Respectful delay between requests
+                    if i < total and not stop_reason:
+                        time.sleep(self.config['settings']['delay_between_checks'])
+                return results
+            
+            completed = 0
+            progress_lock = threading.Lock()
+            
+            def check_and_log(url: str) -> LinkResult:
+                nonlocal completed
+                result = next_result(url)
+                with progress_lock:
+                    completed += 1
+                    if result.status != 'DEFERRED':
+                        self._log_result(result, prefix=f"[{completed}/{total}] ")
+                if on_result:
+                    on_result(result)
+                return result
+            
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, max(total, 1))) as executor:
+                # Workers pick URLs up in submission (priority) order; map() yields
+                # in the same order, keeping reports deterministic
+                return list(executor.map(check_and_log, urls))
+        finally:
+            if stop_reason:
+                self.logger.warning(f"⏸️ Run {stop_reason}; unchecked links are reported as DEFERRED")
+    
+    def prioritize(self, urls: List[str]) -> List[str]:
+        """Order URLs so the most informative checks run first.
+        
+        Skipped URLs and fresh cache hits cost nothing and come first, then
+        URLs whose last check failed, then URLs never checked before
+        (recently added), then expired cache entries, least recently checked
+        first. Without a cache only the skip rules are used.
+        """
+        def priority(url: str) -> Tuple[int, float, str]:
+            if self.skip_matcher.match(url, count=False):
+                return 0, 0.0, url
+            entry = self.cache.get(url) if self.cache else None
+            if entry is None:
+                return 2, 0.0, url
+            if self.cache.is_fresh(entry):
+                return 0, 0.0, url
+            if entry.status != 'PASS':
+                return 1, -entry.checked_at, url
+            return 3, entry.checked_at, url
+        
+        return sorted(urls, key=priority)
+    
+    def _create_include_fetcher(self, include_config: Dict) -> Optional[RemoteIncludeFetcher]:
+        """Set up remote include resolution if it is enabled in the configuration."""
+        if not include_config.get('enabled', False):
+            return None
+        cache = IncludeCache(include_config.get('cache_dir', DEFAULT_CACHE_DIR), include_config.get('ttl', 3600))
+        return RemoteIncludeFetcher(self._fetch_include, cache, self.max_workers,
+                                    include_config.get('max_depth', 3), self.logger)
+    
+    def _fetch_include(self, url: str, headers: Dict[str, str]) -> requests.Response:
+        """GET a remote include through the pooled session, within the host's rate limit."""
+        host = urlparse(url).netloc.lower()
+        with self.throttle.slot(host):
+            return self.session.get(url, headers=headers, timeout=self.config['settings']['timeout'])
+    
+    def _add_remote_include_links(self, file_locations: List[Tuple[str, Dict[str, List[str]]]]) -> None:
+        """Fetch the remote includes of the files and add the links found in them.
+        
+        Includes are fetched concurrently, nested remote includes included.
+        Links from included content are located as ``URL:line:column`` within
+        the include. Links of includes whose content is the same as the copy
+        cached by an earlier run are remembered for incremental mode.
+        """
+        roots: Dict[str, List[str]] = {}
+        for file_path, _ in file_locations:
+            if Path(file_path).suffix.lower() != '.adoc':
+                continue
+            try:
+                content = Path(file_path).read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+            if self.extractor.attributes:
+                content, _ = self.extractor.attributes.expand(content, file_path)
+            roots[file_path] = find_remote_includes(content)
+        if not any(roots.values()):
+            return
+        
+        start = time.perf_counter()
+        contents, children = self.include_fetcher.resolve(url for urls in roots.values() for url in urls)
+        included_links: Dict[str, Dict[str, List[str]]] = {}
+        for url, content in contents.items():
+            included_links[url] = {}
+            for occurrence in self.extractor.extract(content or '', urlparse(url).path):
+                included_links[url].setdefault(occurrence.url, []).append(
+                    f"{url}:{occurrence.line}:{occurrence.column}")
+        
+        self._unchanged_include_links = {
+            link for url, links in included_links.items()
+            if contents[url] is not None and url not in self.include_fetcher.changed for link in links
+        }
+        
+        added = 0
+        for file_path, locations in file_locations:
+            for url in included_closure(roots.get(file_path, []), children):
+                for link, link_locations in included_links.get(url, {}).items():
+                    added += link not in locations
+                    locations.setdefault(link, []).extend(link_locations)
+        stats = ', '.join(f"{count} {outcome}" for outcome, count in self.include_fetcher.stats.items() if count)
+        self.logger.info(f"📥 Resolved {len(contents)} remote includes in {time.perf_counter() - start:.2f}s "
+                         f"({stats}), adding {added} links")
+    
+    def discover_files(self) -> Iterator[str]:
+        """Yield the files to check when none are given (see ``ContentDiscovery``)."""
+        return ContentDiscovery(self.config, self.extractor.handles).discover()
     
     def get_module_name(self, file_path: str) -> str:
         """Extract module name from file path."""
-        filename = Path(file_path).name
+        path = Path(file_path)
+        filename = path.name
         
         # Extract module name from filename
         match = re.match(r'^module-(\d+)-(.+)\.adoc$', filename)
@@ -248,74 +698,337 @@ class LinkChecker:
             return f"Module {module_num}: {module_desc}"
         elif filename == "README.adoc":
             return "README Documentation"
+        elif path.stem.upper() == "README":
+            # Asset folders each have their own README
+            return f"{path.parent.name.replace('-', ' ').title()} README"
         else:
-            return Path(file_path).stem.title()
+            return path.stem.replace('-', ' ').title()
+    
+    def check_internal_references(self, file_paths: List[str]) -> Dict[str, Tuple[List[LinkResult], Dict[str, List[str]]]]:
+        """Resolve the xref:, <<anchor>> and include:: references of the files offline.
+        
+        Every page of the Antora components listed in ``antora.components`` is
+        indexed in one pass, then each reference is looked up in that index.
+        Returns the results and locations of each file's references, keyed
+        by file path; references are reported as written in the source.
+        """
+        start = time.perf_counter()
+        index = ContentIndex(self.config.get('antora', {}).get('components', []), self.extractor.attributes)
+        resolved: Dict[str, Tuple[List[LinkResult], Dict[str, List[str]]]] = {}
+        for file_path in file_paths:
+            if Path(file_path).suffix.lower() != '.adoc':
+                continue
+            module_name = self.get_module_name(file_path)
+            results: Dict[str, LinkResult] = {}
+            locations: Dict[str, List[str]] = {}
+            try:
+                references = index.references(file_path)
+            except (OSError, UnicodeDecodeError) as e:
+                self.logger.error(f"Error reading file {file_path}: {e}")
+                references = []
+            for reference in references:
+                locations.setdefault(reference.text, []).append(reference.location)
+                if reference.text not in results:
+                    status, reason = index.resolve(reference)
+                    results[reference.text] = LinkResult(
+                        url=reference.text,
+                        status_code=None,
+                        status=status,
+                        response_time=0.0,
+                        error_message=reason,
+                        referenced_by=[module_name]
+                    )
+                    if status != 'PASS':
+                        self._log_result(results[reference.text])
+            resolved[file_path] = ([results[text] for text in sorted(results)], locations)
+        
+        total = sum(len(results) for results, _ in resolved.values())
+        broken = sum(1 for results, _ in resolved.values() for result in results if result.status == 'FAIL')
+        self.logger.info(f"📑 Resolved {total} internal references against {index.page_count} pages and "
+                         f"{index.anchor_count} anchors in {(time.perf_counter() - start) * 1000:.0f}ms "
+                         f"({broken} broken)")
+        return resolved
     
     def check_module(self, file_path: str, max_links: Optional[int] = None) -> ModuleResult:
         """Check all links in a module file."""
+        return self.check_modules([file_path], max_links)[0]
+    
+    def check_modules(self, file_paths: Iterable[str], max_links: Optional[int] = None,
+                      since: Optional[str] = None,
+                      shard: Optional[Tuple[int, int]] = None) -> List[ModuleResult]:
+        """Check the links of several files, fetching each unique URL only once.
+        
+        ``file_paths`` may be any iterable, such as ``discover_files()``.
+        Links are extracted from every file first, the de-duplicated URL set is
+        checked in a single pass and each ``LinkResult`` is then shared by every
+        module that references it. ``processing_time`` is the wall time of the
+        whole run, since checks are no longer attributable to a single module.
+        
+        With ``since`` set to a git revision, only links added since that
+        revision are checked; the others reuse their stored cache verdicts.
+        
+        With ``shard`` set to ``(index, count)`` only that shard's share of the
+        de-duplicated URL set is checked, and each module result only holds
+        the links of this shard (see ``merge_partial_results``).
+        """
         start_time = time.time()
-        module_name = self.get_module_name(file_path)
-        
-        self.logger.info(f"🚀 Processing {module_name}")
-        self.logger.info(f"📄 File: {file_path}")
-        
-        # Extract links
-        links = self.extract_links_from_file(file_path)
-        
-        if not links:
-            self.logger.info(f"No links found in {module_name}")
-            return ModuleResult(
-                module_name=module_name,
-                file_path=file_path,
-                total_links=0,
-                passed_links=0,
-                failed_links=0,
-                skipped_links=0,
-                links=[],
-                processing_time=time.time() - start_time
-            )
+        deadline = time.monotonic() + self.time_budget if self.time_budget else None
         
-        # Limit links if specified (for testing)
-        if max_links:
-            links = links[:max_links]
-            self.logger.info(f"🔗 Testing first {len(links)} links (limited for testing)")
-        else:
-            self.logger.info(f"🔗 Found {len(links)} links to validate")
+        # Extract links from all files up front, reading them concurrently as the
+        # file list (possibly a discovery generator) produces them
+        file_locations: List[Tuple[str, Dict[str, List[str]]]] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            extracted = executor.map(lambda path: (str(path), self.extract_occurrences(str(path))), file_paths)
+            for file_path, occurrences in extracted:
+                locations: Dict[str, List[str]] = {}
+                for occurrence in occurrences:
+                    locations.setdefault(occurrence.url, []).append(occurrence.location)
+                file_locations.append((file_path, locations))
         
-        # Check each link
-        results = []
-        for i, url in enumerate(links, 1):
-            self.logger.info(f"[{i}/{len(links)}] Checking: {url}")
+        # Links in remotely included content belong to the including file
+        if self.include_fetcher:
+            self._add_remote_include_links(file_locations)
+        
+        module_links: List[Tuple[str, str, List[str], Dict[str, List[str]]]] = []
+        for file_path, locations in file_locations:
+            module_name = self.get_module_name(file_path)
+            self.logger.info(f"🚀 Processing {module_name}")
+            self.logger.info(f"📄 File: {file_path}")
             
-            result = self.check_url(url)
+            links = sorted(locations)
+            if not links:
+                self.logger.info(f"No links found in {module_name}")
+            elif max_links:
+                # Limit links if specified (for testing), keeping the highest priority ones
+                links = sorted(self.prioritize(links)[:max_links])
+                self.logger.info(f"🔗 Testing first {len(links)} links (limited for testing)")
+            else:
+                self.logger.info(f"🔗 Found {len(links)} links to validate")
+            module_links.append((module_name, file_path, links, locations))
+        
+        # Internal references need no network, so they are resolved before any HTTP
+        # work; with sharding only the first shard reports them
+        internal: Dict[str, Tuple[List[LinkResult], Dict[str, List[str]]]] = {}
+        if module_links and self.config.get('internal_references', {}).get('enabled', False) and (not shard or shard[0] == 1):
+            internal = self.check_internal_references([file_path for _, file_path, _, _ in module_links])
+            for results, locations in internal.values():
+                for result in results:
+                    for sink in self.sinks:
+                        sink.emit(result, locations[result.url])
+        
+        # Deduplicate across the whole run, remembering who references each URL
+        references: Dict[str, List[str]] = {}
+        for module_name, _, links, _ in module_links:
+            for url in links:
+                references.setdefault(url, []).append(module_name)
+        
+        unique_urls = sorted(references)
+        shared_count = sum(1 for modules in references.values() if len(modules) > 1)
+        if len(module_links) > 1:
+            self.logger.info(f"🔗 {len(unique_urls)} unique links across {len(module_links)} files "
+                             f"({shared_count} shared between modules)")
+        
+        if shard:
+            unique_urls = self.select_shard(unique_urls, *shard)
+            shard_urls = set(unique_urls)
+            module_links = [
+                (module_name, file_path, [url for url in links if url in shard_urls], locations)
+                for module_name, file_path, links, locations in module_links
+            ]
+            self.logger.info(f"🧩 Shard {shard[0]}/{shard[1]}: checking {len(unique_urls)} of "
+                             f"{len(references)} unique links")
+        
+        all_locations: Dict[str, List[str]] = {}
+        for _, _, _, locations in module_links:
+            for url, url_locations in locations.items():
+                all_locations.setdefault(url, []).extend(url_locations)
+        
+        def emit(result: LinkResult) -> None:
+            result.referenced_by = references[result.url]
+            for sink in self.sinks:
+                sink.emit(result, all_locations.get(result.url, []))
+        
+        checked: Dict[str, LinkResult] = {}
+        if since:
+            checked = self._reuse_unchanged_results(module_links, unique_urls, since)
+            for result in checked.values():
+                emit(result)
+        to_check = [url for url in unique_urls if url not in checked]
+        if deadline is not None or self.fail_fast:
+            to_check = self.prioritize(to_check)
+        if self.anchor_index:
+            self.anchor_index.plan(to_check)
+        checked.update(zip(to_check, self.check_urls(to_check, on_result=emit,
+                                                     deadline=deadline, fail_fast=self.fail_fast)))
+        if self.anchor_index and self.anchor_index.pages_fetched:
+            self.logger.info(f"🔖 Validated fragments against {self.anchor_index.pages_fetched} downloaded pages")
+        for url, result in checked.items():
+            result.referenced_by = references[url]
+        
+        processing_time = time.time() - start_time
+        module_results = []
+        for module_name, file_path, links, locations in module_links:
+            internal_results, internal_locations = internal.get(file_path, ([], {}))
+            module_result = self._build_module_result(module_name, file_path,
+                                                      [checked[url] for url in links] + internal_results,
+                                                      processing_time)
+            module_result.locations = {url: locations[url] for url in links}
+            module_result.locations.update(internal_locations)
+            module_results.append(module_result)
+        return module_results
+    
+    def select_shard(self, urls: List[str], index: int, count: int) -> List[str]:
+        """Return the URLs belonging to shard ``index`` (1-based) of ``count``.
+        
+        URLs are spread across shards host by host, always filling the least
+        loaded shard, so every shard gets a similar share of each host and a
+        similar estimated cost. The cost of a URL is the time its host's rate
+        limit allows per request (skipped URLs cost nothing). The partition is
+        deterministic, so every shard computes the same assignment.
+        """
+        by_host: Dict[str, List[str]] = {}
+        for url in sorted(urls):
+            by_host.setdefault(urlparse(url).netloc.lower(), []).append(url)
+        
+        def url_cost(url: str) -> float:
+            if self.skip_matcher.match(url, count=False):
+                return 0.0
+            return 1.0 / self.throttle.configured_rate(urlparse(url).netloc.lower())
+        
+        loads = [0.0] * count
+        selected = []
+        # Most expensive hosts first so the cheap ones fill the remaining gaps
+        hosts = sorted(by_host, key=lambda host: (-sum(url_cost(url) for url in by_host[host]), host))
+        for host in hosts:
+            for url in by_host[host]:
+                target = min(range(count), key=lambda i: (loads[i], i))
+                loads[target] += url_cost(url) or 1e-6
+                if target == index - 1:
+                    selected.append(url)
+        return sorted(selected)
+    
+    def save_partial_results(self, results: List[ModuleResult], output_file: str,
+                             shard: Optional[Tuple[int, int]] = None) -> None:
+        """Write module results to a JSON file that ``merge_partial_results`` can combine."""
+        with open(output_file, 'w') as f:
+            json.dump({
+                'shard': list(shard) if shard else None,
+                'generated': datetime.now().isoformat(),
+                'modules': [asdict(result) for result in results]
+            }, f, indent=2)
+        self.logger.info(f"🧩 Partial results written: {output_file}")
+    
+    def merge_partial_results(self, partial_files: List[str]) -> List[ModuleResult]:
+        """Combine partial result files from several shards into one result per module."""
+        merged: Dict[str, Dict] = {}
+        processing_time = 0.0
+        for partial_file in partial_files:
+            with open(partial_file, 'r') as f:
+                partial = json.load(f)
+            for module in partial['modules']:
+                entry = merged.setdefault(module['file_path'], {
+                    'module_name': module['module_name'],
+                    'links': {},
+                    'locations': {}
+                })
+                for link in module['links']:
+                    entry['links'][link['url']] = LinkResult.from_dict(link)
+                entry['locations'].update(module.get('locations', {}))
+                processing_time = max(processing_time, module['processing_time'])
+        
+        self.logger.info(f"🧩 Merged {len(partial_files)} partial result files")
+        results = []
+        emitted: Dict[str, LinkResult] = {}
+        all_locations: Dict[str, List[str]] = {}
+        for file_path, entry in merged.items():
+            links = [entry['links'][url] for url in sorted(entry['links'])]
+            result = self._build_module_result(entry['module_name'], file_path, links, processing_time)
+            result.locations = {url: entry['locations'].get(url, []) for url in sorted(entry['links'])}
             results.append(result)
-            
-            # Log result
-            if result.status == 'PASS':
-                self.logger.info(f"✅ PASS: {url} ({result.response_time:.2f}s)")
-            elif result.status == 'SKIP':
-                self.logger.info(f"⚠️ SKIP: {url} - {result.error_message}")
-            elif result.status == 'FAIL':
-                self.logger.error(f"❌ FAIL: {url} - {result.error_message}")
+            for link in links:
+                emitted.setdefault(link.url, link)
+                all_locations.setdefault(link.url, []).extend(result.locations[link.url])
+        
+        # Stream the merged set once per unique URL, as a single run would have
+        for url in sorted(emitted):
+            for sink in self.sinks:
+                sink.emit(emitted[url], all_locations[url])
+        return results
+    
+    def write_redirect_patch(self, results: List[ModuleResult], output_file: str) -> None:
+        """Write a patch that replaces permanently redirected URLs in the checked files."""
+        rewritten, files = write_redirect_patch(results, output_file)
+        if rewritten:
+            self.logger.info(f"🔀 Redirect rewrite patch written: {output_file} "
+                             f"({rewritten} URLs in {files} files, apply with: git apply {output_file})")
+        else:
+            self.logger.info(f"🔀 No permanent redirects to rewrite; wrote empty patch {output_file}")
+    
+    def _links_at_revision(self, file_path: str, revision: str) -> Optional[set]:
+        """Return the links a file contained at a git revision (None if it did not exist)."""
+        try:
+            toplevel = subprocess.run(
+                ['git', 'rev-parse', '--show-toplevel'],
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+            relative_path = Path(file_path).resolve().relative_to(toplevel).as_posix()
+            content = subprocess.run(
+                ['git', 'show', f"{revision}:{relative_path}"],
+                capture_output=True, text=True, check=True
+            ).stdout
+        except (subprocess.CalledProcessError, ValueError, OSError):
+            return None
+        return {occurrence.url for occurrence in self.extractor.extract(content, file_path)}
+    
+    def _reuse_unchanged_results(self, module_links: List[Tuple[str, str, List[str], Dict[str, List[str]]]],
+                                 unique_urls: List[str], since: str) -> Dict[str, LinkResult]:
+        """Return stored results for links that have not changed since a git revision.
+        
+        Links from remote includes are not in git; they count as unchanged
+        when their include's content is the same as the cached copy from an
+        earlier run.
+        """
+        if not self.cache:
+            self.logger.warning("Incremental mode needs the result cache; checking all links")
+            return {}
+        
+        added = set()
+        for module_name, file_path, links, _ in module_links:
+            baseline = self._links_at_revision(file_path, since)
+            if baseline is None:
+                self.logger.info(f"🆕 {module_name}: not present at {since}, checking all links")
+                added.update(links)
             else:
-                self.logger.error(f"🔥 ERROR: {url} - {result.error_message}")
-            
-            # Respectful delay between requests
-            if i < len(links):
-                time.sleep(self.config['settings']['delay_between_checks'])
+                added.update(url for url in links
+                             if url not in baseline and url not in self._unchanged_include_links)
+        
+        reused = {}
+        for url in unique_urls:
+            if url in added or self.skip_matcher.match(url, count=False):
+                continue
+            entry = self.cache.get(url)
+            if entry:
+                reused[url] = self._result_from_cache(url, entry, time.time(), 'STORED')
         
+        self.logger.info(f"♻️ Incremental mode since {since}: {len(added)} new or changed links, "
+                         f"{len(reused)} unchanged links reused from the previous run")
+        return reused
+    
+    def _build_module_result(self, module_name: str, file_path: str, results: List[LinkResult],
+                             processing_time: float) -> ModuleResult:
+        """Aggregate link results into a ModuleResult and log the module summary."""
         # Calculate statistics
         passed = sum(1 for r in results if r.status == 'PASS')
         failed = sum(1 for r in results if r.status == 'FAIL')
         skipped = sum(1 for r in results if r.status == 'SKIP')
-        
-        processing_time = time.time() - start_time
+        deferred = sum(1 for r in results if r.status == 'DEFERRED')
+        deferred_note = f", {deferred} deferred" if deferred else ""
         
         # Log module summary
         if failed == 0:
-            self.logger.info(f"✅ {module_name}: ALL LINKS WORKING ({passed} passed, {skipped} skipped)")
+            self.logger.info(f"✅ {module_name}: ALL LINKS WORKING ({passed} passed, {skipped} skipped{deferred_note})")
         else:
-            self.logger.error(f"❌ {module_name}: {failed} LINKS FAILED ({passed} passed, {skipped} skipped)")
+            self.logger.error(f"❌ {module_name}: {failed} LINKS FAILED ({passed} passed, {skipped} skipped{deferred_note})")
         
         return ModuleResult(
             module_name=module_name,
@@ -325,9 +1038,53 @@ class LinkChecker:
             failed_links=failed,
             skipped_links=skipped,
             links=results,
-            processing_time=processing_time
+            processing_time=processing_time,
+            deferred_links=deferred
         )
     
+    def _write_performance_section(self, f, timed: List[LinkResult]) -> None:
+        """Write per-host latency percentiles and the slowest URLs with their timing breakdown.
+        
+        Hosts and URLs are ranked by network time. Time spent queueing for
+        the checker's own per-host slots and token buckets is shown
+        separately, so a host with a low configured rate does not look slow.
+        """
+        top = self.config['output'].get('performance_top', 10)
+        by_host: Dict[str, List[LinkResult]] = {}
+        for link in timed:
+            by_host.setdefault(urlparse(link.url).netloc.lower(), []).append(link)
+        percentiles = host_percentiles({host: [link.timing.network for link in links]
+                                        for host, links in by_host.items()})
+        
+        phases = ('queue', 'dns', 'connect', 'tls', 'ttfb', 'transfer')
+        totals = {phase: sum(getattr(link.timing, phase) for link in timed) for phase in phases}
+        retries = sum(link.timing.retries for link in timed)
+        received = sum(link.timing.approx_bytes for link in timed)
+        f.write("\n## ⏱️ Performance\n\n")
+        f.write(f"**Live Checks:** {len(timed)} ({retries} retries, about {received / 1024:.1f} KiB received)\n")
+        f.write("**Time Breakdown:** " + ", ".join(
+            f"{label} {totals[phase]:.2f}s" for phase, label in
+            zip(phases, ('queued', 'DNS', 'connect', 'TLS', 'TTFB', 'transfer'))) + "\n\n")
+        
+        f.write("### Slowest Hosts\n\n")
+        f.write("| Host | Checks | p50 | p95 | p99 | Queued | DNS | Connect | TLS | TTFB | Retries |\n")
+        f.write("|------|-------:|----:|----:|----:|-------:|----:|--------:|----:|-----:|--------:|\n")
+        for host in sorted(percentiles, key=lambda h: (-percentiles[h]['p95'], h))[:top]:
+            links = by_host[host]
+            stats = percentiles[host]
+            means = [_mean([getattr(link.timing, phase) for link in links]) for phase in phases[:5]]
+            f.write(f"| {host} | {len(links)} | {stats['p50']:.3f}s | {stats['p95']:.3f}s | {stats['p99']:.3f}s | "
+                    + " | ".join(f"{value:.3f}s" for value in means)
+                    + f" | {sum(link.timing.retries for link in links)} |\n")
+        
+        f.write("\n### Slowest URLs\n\n")
+        f.write("| URL | Network | Queued | DNS | Connect | TLS | TTFB | Transfer | Retries | ~Bytes |\n")
+        f.write("|-----|--------:|-------:|----:|--------:|----:|-----:|---------:|--------:|-------:|\n")
+        for link in sorted(timed, key=lambda link: (-link.timing.network, link.url))[:top]:
+            f.write(f"| {link.url} | {link.timing.network:.3f}s | "
+                    + " | ".join(f"{getattr(link.timing, phase):.3f}s" for phase in phases)
+                    + f" | {link.timing.retries} | {link.timing.approx_bytes} |\n")
+    
     def generate_report(self, results: List[ModuleResult]) -> None:
         """Generate markdown report from results."""
         report_file = self.config['output']['issue_file']
@@ -337,23 +1094,47 @@ class LinkChecker:
         total_passed = sum(r.passed_links for r in results)
         total_failed = sum(r.failed_links for r in results)
         total_skipped = sum(r.skipped_links for r in results)
+        total_deferred = sum(r.deferred_links for r in results)
+        # Deferred links were never requested, so they are reported on their own
+        total_checked = total_links - total_deferred
+        checked_links = {link.url: link for r in results for link in r.links}
+        unique_urls = {url for url, link in checked_links.items() if link.status != 'DEFERRED'}
+        shared_urls = len({link.url for r in results for link in r.links if len(link.referenced_by) > 1})
         
         with open(report_file, 'w') as f:
             f.write("# OpenShift Bare Metal Workshop - Link Validation Report\n\n")
             f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Total Links Checked:** {total_links}\n")
+            f.write(f"**Total Links Checked:** {total_checked}\n")
             f.write(f"**Passed Links:** {total_passed}\n")
             f.write(f"**Failed Links:** {total_failed}\n")
             f.write(f"**Skipped Links:** {total_skipped}\n")
-            f.write(f"**Success Rate:** {(total_passed * 100 // total_links) if total_links > 0 else 0}%\n\n")
+            if total_deferred:
+                f.write(f"**Deferred Links:** {total_deferred} (not checked within the time budget or after fail-fast)\n")
+            f.write(f"**Success Rate:** {(total_passed * 100 // total_checked) if total_checked > 0 else 0}%\n\n")
+            
+            if len(results) > 1:
+                f.write(f"**Unique URLs Checked:** {len(unique_urls)}\n")
+                f.write(f"**Shared Between Modules:** {shared_urls}\n\n")
+            if self.cache:
+                cache_hits = sum(1 for link in checked_links.values() if link.cache_status == 'HIT')
+                revalidated = sum(1 for link in checked_links.values() if link.cache_status == 'REVALIDATED')
+                stored = sum(1 for link in checked_links.values() if link.cache_status == 'STORED')
+                f.write(f"**Cache Hits:** {cache_hits} fresh, {revalidated} revalidated (304 Not Modified)\n")
+                if stored:
+                    f.write(f"**Unchanged Links Reused:** {stored}\n")
+                f.write("\n")
             
             # Module summaries
             f.write("## Module Summary\n\n")
             for result in results:
                 status_icon = "✅" if result.failed_links == 0 else "❌"
+                shared = sum(1 for link in result.links if len(link.referenced_by) > 1)
                 f.write(f"- {status_icon} **{result.module_name}**: ")
                 f.write(f"{result.total_links} links ({result.passed_links} passed, ")
-                f.write(f"{result.failed_links} failed, {result.skipped_links} skipped)\n")
+                f.write(f"{result.failed_links} failed, {result.skipped_links} skipped")
+                if result.deferred_links:
+                    f.write(f", {result.deferred_links} deferred")
+                f.write(f", {shared} shared)\n" if shared else ")\n")
             
             # Failed links details
             if total_failed > 0:
@@ -364,53 +1145,160 @@ class LinkChecker:
                         f.write(f"### {result.module_name}\n\n")
                         for link in failed_links:
                             f.write(f"- ❌ {link.url}\n")
+                            if result.locations.get(link.url):
+                                f.write(f"  - **Location**: {', '.join(result.locations[link.url])}\n")
                             f.write(f"  - **Error**: {link.error_message}\n")
                             if link.status_code:
                                 f.write(f"  - **Status Code**: {link.status_code}\n")
+                            if link.method:
+                                f.write(f"  - **Method**: {link.method}\n")
+                            if len(link.referenced_by) > 1:
+                                f.write(f"  - **Shared With**: {', '.join(m for m in link.referenced_by if m != result.module_name)}\n")
                             f.write(f"  - **Response Time**: {link.response_time:.2f}s\n\n")
             
+            # Links the run did not get to; being uncached, they are scheduled early next run
+            deferred = sorted(url for url, link in checked_links.items() if link.status == 'DEFERRED')
+            if deferred:
+                f.write(f"\n## ⏸️ Deferred Links ({len(deferred)})\n\n")
+                for url in deferred:
+                    f.write(f"- {url}\n")
+            
+            # Redirect chains cost a round trip per hop for the checker and readers alike
+            redirected = [link for link in checked_links.values() if link.redirects and link.status == 'PASS']
+            if redirected:
+                total_hops = sum(len(link.redirects) for link in redirected)
+                hop_time = sum(hop.elapsed for link in redirected for hop in link.redirects)
+                permanent = sum(1 for link in redirected if permanent_target(link))
+                f.write(f"\n## ↪️ Redirected Links ({len(redirected)})\n\n")
+                f.write(f"**Redirect Hops:** {total_hops} ({hop_time:.2f}s spent before the final response)\n")
+                f.write(f"**Permanent Redirects:** {permanent} (rewrite with `--rewrite-redirects PATCH`)\n\n")
+                for link in sorted(redirected, key=lambda link: (-len(link.redirects), link.url)):
+                    chain = ', '.join(f"{hop.status_code} {hop.elapsed:.2f}s" for hop in link.redirects)
+                    f.write(f"- {link.url} → {link.final_url} ({len(link.redirects)} hops: {chain})\n")
+            
+            # Where the network time of the live checks went
+            timed = [link for link in checked_links.values() if link.timing is not None]
+            if timed:
+                self._write_performance_section(f, timed)
+            
+            # Skip rules that never fired are candidates for pruning
+            unused_rules = self.skip_matcher.unused_rules()
+            if unused_rules and self.skip_matcher.evaluated:
+                f.write(f"\n## 🧹 Unused Skip Rules ({len(unused_rules)})\n\n")
+                for pattern in unused_rules:
+                    f.write(f"- `{pattern}`\n")
+            
             f.write("\n---\n")
             f.write("*Report generated by OpenShift Workshop Python Link Checker*\n")
         
+        for pattern, hits in self.skip_matcher.hits.most_common():
+            self.logger.info(f"⚠️ Skip rule matched {hits} URL(s): {pattern}")
         self.logger.info(f"📋 Report generated: {report_file}")
 
+def _mean(values: List[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse a ``--shard i/N`` argument."""
+    try:
+        index, count = (int(part) for part in value.split('/', 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected i/N")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected 1 <= i <= N")
+    return index, count
+
 def main():
     """Main function with command line interface."""
     parser = argparse.ArgumentParser(description='OpenShift Workshop Link Checker')
-    parser.add_argument('files', nargs='*', help='Files to check (default: all modules)')
+    parser.add_argument('files', nargs='*',
+                       help='Files to check (default: all modules), or "merge" followed by partial result files')
     parser.add_argument('--config', default='scripts/link-checker-config.json',
                        help='Configuration file path')
     parser.add_argument('--test-mode', action='store_true',
                        help='Test mode: check only first 3 links per file')
     parser.add_argument('--max-links', type=int,
                        help='Maximum number of links to check per file')
+    parser.add_argument('--workers', type=int,
+                       help='Number of concurrent checks (1 = sequential, overrides config)')
+    parser.add_argument('--cache-file',
+                       help='Result cache file (overrides config)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the persistent result cache for this run')
+    parser.add_argument('--since', metavar='GIT_REV',
+                       help='Only check links added since this git revision; reuse stored results for the rest')
+    parser.add_argument('--shard', type=parse_shard, metavar='I/N',
+                       help='Only check shard I of N of the de-duplicated link set')
+    parser.add_argument('--partial-output', metavar='FILE',
+                       help='Write results as a partial result file for "merge" (default with --shard: link-check-shard-I.json)')
+    parser.add_argument('--jsonl', metavar='FILE',
+                       help='Stream each result to a JSON Lines file as it completes')
+    parser.add_argument('--junit', metavar='FILE',
+                       help='Write results as JUnit XML')
+    parser.add_argument('--sarif', metavar='FILE',
+                       help='Write failed links as a SARIF log')
+    parser.add_argument('--time-budget', type=float, metavar='SECONDS',
+                       help='Stop starting new checks after this many seconds; the rest are reported as DEFERRED')
+    parser.add_argument('--fail-fast', action='store_true',
+                       help='Stop at the first failed link (remaining links are reported as DEFERRED)')
+    parser.add_argument('--rewrite-redirects', metavar='PATCH',
+                       help='Write a patch replacing permanently redirected (301/308) URLs with their targets')
 
     args = parser.parse_args()
     
     # Initialize checker
     checker = LinkChecker(args.config)
+    if args.workers:
+        checker.set_workers(args.workers)
+    if args.time_budget:
+        checker.time_budget = args.time_budget
+    checker.fail_fast = args.fail_fast
+    if args.no_cache:
+        checker.set_cache(None)
+    elif args.cache_file:
+        checker.set_cache(args.cache_file)
+    if args.jsonl:
+        checker.add_sink(JsonLinesSink(args.jsonl))
+    if args.junit:
+        checker.add_sink(JUnitSink(args.junit))
+    if args.sarif:
+        checker.add_sink(SarifSink(args.sarif))
     
-    # Determine files to check
-    if args.files:
-        files_to_check = args.files
-    else:
-        # Default: all module files
-        content_dir = Path("content/modules/ROOT/pages")
-        files_to_check = list(content_dir.glob("module-*.adoc"))
-        readme_file = Path("README.adoc")
-        if readme_file.exists():
-            files_to_check.append(readme_file)
-    
-    # Check files
     results = []
-    max_links = 3 if args.test_mode else args.max_links
-    
-    for file_path in files_to_check:
-        if Path(file_path).exists():
-            result = checker.check_module(str(file_path), max_links)
-            results.append(result)
+    if args.files and args.files[0] == 'merge':
+        # Combine partial results written by sharded runs
+        results = checker.merge_partial_results(args.files[1:])
+        checker.close_sinks()
+    else:
+        # Determine files to check
+        if args.files:
+            files_to_check = []
+            for file_path in args.files:
+                if Path(file_path).exists():
+                    files_to_check.append(file_path)
+                else:
+                    checker.logger.error(f"File not found: {file_path}")
         else:
-            checker.logger.error(f"File not found: {file_path}")
+            # Default: the configured directories, files and Antora components
+            files_to_check = checker.discover_files()
+        
+        # Check files
+        max_links = 3 if args.test_mode else args.max_links
+        
+        try:
+            results = checker.check_modules(files_to_check, max_links, since=args.since, shard=args.shard)
+        finally:
+            # Leave complete sink output behind even if the run is interrupted
+            checker.close_sinks()
+        
+        partial_output = args.partial_output
+        if args.shard and not partial_output:
+            partial_output = f"link-check-shard-{args.shard[0]}.json"
+        if partial_output:
+            checker.save_partial_results(results, partial_output, args.shard)
+    
+    if args.rewrite_redirects and results:
+        checker.write_redirect_patch(results, args.rewrite_redirects)
     
     # Generate report
     if results:
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Link Extractor
+Single-pass, precompiled link extraction driven by the config file_patterns.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Tuple, Union
+
+from asciidoc_attributes import AttributeResolver, OffsetMap
+
+# Used for files whose extension has no configured patterns
+BARE_URL_PATTERN = r"(?P<url>https?://[^\s\[\]<>()]+)"
+
+@dataclass
+class LinkOccurrence:
+    """A single occurrence of a URL in a source file."""
+    url: str
+    file_path: str
+    line: int
+    column: int
+
+    @property
+    def location(self) -> str:
+        """Location in ``path:line:column`` form."""
+        return f"{self.file_path}:{self.line}:{self.column}"
+
+class LinkExtractor:
+    """Extract links from files using the per-extension patterns in the config.
+
+    All patterns for an extension are combined into one alternation and
+    compiled once, so each file is tokenized in a single linear pass.
+    Patterns are tried in their configured order at every position, which
+    lets a ``link:URL[...]`` macro consume its URL before the bare URL
+    pattern can match it again. Each pattern should capture the URL in a
+    ``(?P<url>...)`` group; otherwise the first capturing group (or the
+    whole match) is used. An invalid pattern raises ``ValueError``.
+
+    For extensions whose spec sets ``expand_attributes``, ``{attribute}``
+    references are expanded with ``attributes`` before matching; locations
+    of links found in expanded text point at the reference in the source.
+    """
+
+    def __init__(self, file_patterns: Optional[Dict] = None, attributes: Optional[AttributeResolver] = None):
+        self._rules: Dict[str, Tuple[Pattern, List[Union[str, int]]]] = {}
+        self._expand: set = set()
+        for spec in (file_patterns or {}).values():
+            compiled = self._compile(spec.get('link_patterns', []))
+            for extension in spec.get('extensions', []):
+                self._rules[extension.lower()] = compiled
+                if spec.get('expand_attributes'):
+                    self._expand.add(extension.lower())
+        self._default = self._compile([BARE_URL_PATTERN])
+        self.attributes = attributes
+
+    @staticmethod
+    def _compile(patterns: List[str]) -> Tuple[Pattern, List[Union[str, int]]]:
+        """Combine patterns into one regex, returning it with each alternative's URL group.
+
+        A ``(?P<url>...)`` group is renamed per alternative. Otherwise the
+        URL group is the pattern's first capturing group, located by its
+        number in the combined regex rather than by rewriting the pattern
+        text, so parentheses inside character classes are left alone.
+        """
+        alternatives = []
+        url_groups: List[Union[str, int]] = []
+        group_count = 0
+        for index, pattern in enumerate(patterns or [BARE_URL_PATTERN]):
+            try:
+                groups = re.compile(pattern).groups
+            except re.error as e:
+                raise ValueError(f"Invalid link pattern {pattern!r}: {e}") from e
+            if "(?P<url>" in pattern:
+                group = f"u{index}"
+                pattern = pattern.replace("(?P<url>", f"(?P<{group}>")
+            else:
+                if not groups:
+                    pattern = f"({pattern})"
+                    groups = 1
+                # Groups are numbered by their opening parenthesis across the whole regex
+                group = group_count + 1
+            alternatives.append(f"(?:{pattern})")
+            url_groups.append(group)
+            group_count += groups
+        return re.compile("|".join(alternatives)), url_groups
+
+    def handles(self, file_path: str) -> bool:
+        """Whether the config has link patterns for this file's extension."""
+        return Path(file_path).suffix.lower() in self._rules
+
+    def rule_for(self, file_path: str) -> Tuple[Pattern, List[Union[str, int]]]:
+        """Return the compiled rule for a file based on its extension."""
+        return self._rules.get(Path(file_path).suffix.lower(), self._default)
+
+    def extract(self, content: str, file_path: str) -> List[LinkOccurrence]:
+        """Extract every http(s) link occurrence from content, in source order."""
+        regex, url_groups = self.rule_for(file_path)
+        line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+        text, offsets = content, OffsetMap([])
+        if self.attributes and Path(file_path).suffix.lower() in self._expand:
+            text, offsets = self.attributes.expand(content, file_path)
+
+        occurrences = []
+        for match in regex.finditer(text):
+            group = next((g for g in url_groups if match.group(g) is not None), None)
+            if group is None:
+                continue
+            url = match.group(group).strip()
+            if not url.startswith(("http://", "https://")):
+                continue
+            offset = offsets.original(match.start(group))
+            line = bisect_right(line_starts, offset)
+            occurrences.append(LinkOccurrence(
+                url=url,
+                file_path=file_path,
+                line=line,
+                column=offset - line_starts[line - 1] + 1
+            ))
+        return occurrences
+
+    def extract_file(self, file_path: str) -> List[LinkOccurrence]:
+        """Read a file and extract its link occurrences."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return self.extract(f.read(), str(file_path))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Link Checker Rate Limiter
+Per-host token buckets with adaptive backoff driven by 429/503 responses.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Optional
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of blocking."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how long the caller must wait to use it."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+class HostRateLimiter:
+    """Per-host concurrency caps and token-bucket rate limits.
+
+    Every host gets its own bucket refilled at ``requests_per_second``.
+    Throttling responses halve the host's rate (down to ``min_rate``) and
+    block the whole host until the Retry-After delay has passed; each
+    successful request then restores the rate additively.
+    """
+
+    def __init__(self, max_concurrent: int = 2, requests_per_second: float = 2.0, burst: float = 2,
+                 min_rate: float = 0.1, max_backoff: float = 300,
+                 host_overrides: Optional[Dict[str, Dict]] = None):
+        self.max_concurrent = max(1, max_concurrent)
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_backoff = max_backoff
+        self.host_overrides = host_overrides or {}
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._blocked_until: Dict[str, float] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "HostRateLimiter":
+        """Build a limiter from the checker configuration."""
+        rate_limit = config.get('rate_limit', {})
+        return cls(
+            max_concurrent=config['settings'].get('per_host_concurrency', 2),
+            requests_per_second=rate_limit.get('requests_per_second', 2.0),
+            burst=rate_limit.get('burst', 2),
+            min_rate=rate_limit.get('min_rate', 0.1),
+            max_backoff=rate_limit.get('max_backoff', 300),
+            host_overrides=rate_limit.get('hosts', {})
+        )
+
+    def configured_rate(self, host: str) -> float:
+        """Requests per second configured for a host, before any backoff."""
+        return self.host_overrides.get(host, {}).get('requests_per_second', self.requests_per_second)
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            burst = self.host_overrides.get(host, {}).get('burst', self.burst)
+            bucket = TokenBucket(self.configured_rate(host), burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    @contextmanager
+    def slot(self, host: str) -> Iterator[None]:
+        """Hold one of the host's request slots once a token is available."""
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_concurrent)
+                self._semaphores[host] = semaphore
+
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                wait = max(self._bucket(host).reserve(now), self._blocked_until.get(host, now) - now)
+            if wait > 0:
+                time.sleep(wait)
+            yield
+
+    def penalize(self, host: str, delay: float) -> float:
+        """Slow a host down after a throttling response.
+
+        Halves the host's rate and blocks new requests to it for ``delay``
+        seconds (capped at ``max_backoff``). Returns the delay applied.
+        """
+        delay = min(max(0.0, delay), self.max_backoff)
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.rate = max(self.min_rate, bucket.rate / 2)
+            now = time.monotonic()
+            self._blocked_until[host] = max(self._blocked_until.get(host, now), now + delay)
+        return delay
+
+    def reward(self, host: str) -> None:
+        """Recover a penalized host's rate after a successful request."""
+        with self._lock:
+            bucket = self._bucket(host)
+            configured = self.configured_rate(host)
+            if bucket.rate < configured:
+                bucket.rate = min(configured, bucket.rate + configured / 10)
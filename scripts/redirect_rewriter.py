@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Redirect Rewriter
+Builds a patch that replaces permanently redirected URLs with their final targets.
+"""
+
+import difflib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from result_sinks import parse_location
+
+PERMANENT_REDIRECT_CODES = (301, 308)
+
+def permanent_target(result: Any) -> Optional[str]:
+    """Return the URL a passing link permanently redirects to, if any.
+
+    Only the leading run of 301/308 hops is followed: a temporary redirect
+    further down the chain may change, so the URL it was served from is
+    used as the target instead. A fragment on the original URL is kept,
+    because servers never see it and so it is never part of the redirect.
+    """
+    if result.status != 'PASS' or not result.redirects:
+        return None
+
+    target = None
+    for index, hop in enumerate(result.redirects):
+        if hop.status_code not in PERMANENT_REDIRECT_CODES:
+            break
+        is_last = index + 1 == len(result.redirects)
+        target = result.final_url if is_last else result.redirects[index + 1].url
+    if not target or target == result.url:
+        return None
+
+    fragment = urlsplit(result.url).fragment
+    if fragment and not urlsplit(target).fragment:
+        target = f"{target}#{fragment}"
+    return target
+
+def _patch_path(file_path: str) -> str:
+    """Path as written in the patch headers, relative to the working directory when possible."""
+    path = Path(file_path)
+    if path.is_absolute():
+        try:
+            path = path.relative_to(Path.cwd())
+        except ValueError:
+            pass
+    return path.as_posix()
+
+def build_redirect_patch(results: List[Any]) -> Tuple[str, Dict[str, str]]:
+    """Build a unified diff rewriting permanently redirected URLs at their locations.
+
+    Returns the patch text (empty when nothing needs rewriting) and the
+    URLs it rewrites mapped to their targets.
+    """
+    rewrites: Dict[str, str] = {}
+    edits: Dict[str, set] = {}
+    for result in results:
+        for link in result.links:
+            target = permanent_target(link)
+            if not target:
+                continue
+            rewrites[link.url] = target
+            for location in result.locations.get(link.url, []):
+                path, line, column = parse_location(location)
+                if path.startswith(('http://', 'https://')):
+                    # Found in remotely included content, which is not ours to patch
+                    continue
+                edits.setdefault(path, set()).add((line, column, link.url))
+
+    patches = []
+    applied: Dict[str, str] = {}
+    for path in sorted(edits):
+        with open(path, 'r', encoding='utf-8') as f:
+            original = f.read().splitlines(keepends=True)
+        updated = list(original)
+        # Rewrite from the right so earlier columns on the same line stay valid
+        for line, column, url in sorted(edits[path], reverse=True):
+            text = updated[line - 1]
+            start = column - 1
+            if text[start:start + len(url)] == url:
+                updated[line - 1] = text[:start] + rewrites[url] + text[start + len(url):]
+                applied[url] = rewrites[url]
+        if updated != original:
+            patch_path = _patch_path(path)
+            for diff_line in difflib.unified_diff(original, updated,
+                                                  fromfile=f"a/{patch_path}", tofile=f"b/{patch_path}"):
+                if not diff_line.endswith('\n'):
+                    diff_line += '\n\\ No newline at end of file\n'
+                patches.append(diff_line)
+    return ''.join(patches), applied
+
+def write_redirect_patch(results: List[Any], output_file: str) -> Tuple[int, int]:
+    """Write the rewrite patch to a file and return (URLs rewritten, files touched)."""
+    patch, rewrites = build_redirect_patch(results)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(patch)
+    files = sum(1 for line in patch.splitlines() if line.startswith('+++ '))
+    return len(rewrites), files
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Link Checker Request Timing
+Per-request network timing breakdown collected from instrumented connections.
+"""
+
+import socket
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from socket import timeout as SocketTimeout
+from typing import Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util import connection
+from urllib3.util.connection import allowed_gai_family
+
+@dataclass
+class RequestTiming:
+    """Where the time of one link check went, summed over redirects and retries.
+
+    Connection phases are zero when a pooled connection was reused.
+    ``queue`` is time spent before any request left the checker and is not
+    part of ``network``. Every phase is measured per attempt inside the
+    connection, so urllib3's backoff sleeps between retries are not counted.
+    """
+    queue: float = 0.0  # Waiting for the host's slot, token bucket and backoff
+    dns: float = 0.0  # Host name resolution
+    connect: float = 0.0  # TCP handshake
+    tls: float = 0.0  # TLS handshake
+    ttfb: float = 0.0  # Request sent until response headers arrived
+    transfer: float = 0.0  # Reading response bodies
+    retries: int = 0  # Retries by urllib3 and by the rate limiter
+    approx_bytes: int = 0  # Size of the parsed headers plus decoded body bytes read, not wire bytes
+
+    @property
+    def network(self) -> float:
+        """Time spent on the network, excluding the checker's own queueing."""
+        return self.dns + self.connect + self.tls + self.ttfb + self.transfer
+
+    def record_response(self, response: requests.Response) -> None:
+        """Add the hidden retries and estimated header size of a response and its redirects.
+
+        The header size is rebuilt from the parsed status line and headers,
+        since the raw bytes are not kept by http.client.
+        """
+        for hop in response.history + [response]:
+            retries = getattr(hop.raw, 'retries', None)
+            if retries is not None:
+                self.retries += len(retries.history)
+            self.approx_bytes += len(f"HTTP/1.1 {hop.status_code} {hop.reason or ''}\r\n\r\n")
+            self.approx_bytes += sum(len(name) + len(value) + 4 for name, value in hop.headers.items())
+
+_local = threading.local()
+
+@contextmanager
+def measure() -> Iterator[RequestTiming]:
+    """Collect the timing of all requests made by this thread inside the block."""
+    timing = RequestTiming()
+    _local.timing = timing
+    try:
+        yield timing
+    finally:
+        _local.timing = None
+
+def current_timing() -> Optional[RequestTiming]:
+    """Timing being collected by the calling thread, if any."""
+    return getattr(_local, 'timing', None)
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+class TimedHTTPConnection(HTTPConnection):
+    """HTTP connection that reports DNS, TCP connect and TTFB times.
+
+    ``_new_conn`` follows urllib3 2.x (pinned in requirements.txt) but
+    resolves the name itself, timed, and then connects to each resolved
+    address directly so urllib3 does not resolve it again.
+    """
+
+    def _new_conn(self) -> socket.socket:
+        timing = current_timing()
+        start = time.perf_counter()
+        resolved = None
+        try:
+            try:
+                addresses = socket.getaddrinfo(self._dns_host.strip('[]'), self.port,
+                                               allowed_gai_family(), socket.SOCK_STREAM)
+            except socket.gaierror as e:
+                raise NameResolutionError(self.host, self, e) from e
+            resolved = time.perf_counter()
+
+            error: Optional[OSError] = None
+            for _, _, _, _, sockaddr in addresses:
+                try:
+                    sock = connection.create_connection(
+                        sockaddr[:2],
+                        self.timeout,
+                        source_address=self.source_address,
+                        socket_options=self.socket_options,
+                    )
+                    sys.audit("http.client.connect", self, self.host, self.port)
+                    return sock
+                except SocketTimeout as e:
+                    raise ConnectTimeoutError(
+                        self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+                    ) from e
+                except OSError as e:
+                    error = e
+            raise NewConnectionError(self, f"Failed to establish a new connection: {error}") from error
+        finally:
+            # Failed lookups and connection attempts count towards their phase too
+            if timing is not None:
+                now = time.perf_counter()
+                timing.dns += (resolved or now) - start
+                timing.connect += now - (resolved or now)
+
+    def getresponse(self, *args, **kwargs):
+        """Read the response headers, timing this attempt's wait as TTFB."""
+        timing = current_timing()
+        start = time.perf_counter()
+        try:
+            return super().getresponse(*args, **kwargs)
+        finally:
+            # Timed out and failed attempts count too; backoff sleeps happen outside
+            if timing is not None:
+                timing.ttfb += time.perf_counter() - start
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    """HTTPS connection that also reports the TLS handshake time."""
+
+    def connect(self) -> None:
+        timing = current_timing()
+        if timing is None:
+            return super().connect()
+        before = timing.dns + timing.connect
+        start = time.perf_counter()
+        super().connect()
+        timing.tls += time.perf_counter() - start - (timing.dns + timing.connect - before)
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class TimingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools use the timed connections."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool
+        }
+
+def host_percentiles(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    """p50/p95/p99 of the samples collected for each host."""
+    return {
+        host: {f"p{pct}": percentile(values, pct) for pct in (50, 95, 99)}
+        for host, values in samples.items() if values
+    }
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Link Checker Result Sinks
+Streaming, machine-readable output of link results (JSON Lines, JUnit XML, SARIF).
+"""
+
+import json
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import asdict
+from typing import Any, Dict, List, Tuple
+
+def parse_location(location: str) -> Tuple[str, int, int]:
+    """Split a ``path:line:column`` location into its parts."""
+    path, line, column = location.rsplit(':', 2)
+    return path, int(line), int(column)
+
+def _write_atomically(path: str, content: str) -> None:
+    """Replace a file in one step so readers never see a half-written document."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+class ResultSink:
+    """Receives each link result as soon as it completes.
+
+    ``emit`` may be called from several worker threads at once; subclasses
+    implement ``_emit`` and are serialized by the base class.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, result: Any, locations: List[str]) -> None:
+        """Record one completed ``LinkResult`` and the places it is referenced."""
+        record = asdict(result)
+        record['locations'] = list(locations)
+        with self._lock:
+            self._emit(record)
+
+    def _emit(self, record: Dict) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flush any buffered output."""
+
+class JsonLinesSink(ResultSink):
+    """Append one JSON object per result, flushed immediately."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def _emit(self, record: Dict) -> None:
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+class DocumentSink(ResultSink):
+    """Sink that renders a complete document from the records received so far.
+
+    The document is rewritten at most once per ``flush_interval`` seconds and
+    again on close, so an interrupted run still leaves a valid file.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        super().__init__(path)
+        self.flush_interval = flush_interval
+        self.records: List[Dict] = []
+        self._last_flush = 0.0
+
+    def _emit(self, record: Dict) -> None:
+        self.records.append(record)
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self._flush()
+
+    def _flush(self) -> None:
+        _write_atomically(self.path, self.render())
+        self._last_flush = time.monotonic()
+
+    def render(self) -> str:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+
+class JUnitSink(DocumentSink):
+    """JUnit XML with one test case per checked URL."""
+
+    def render(self) -> str:
+        failures = sum(1 for r in self.records if r['status'] == 'FAIL')
+        errors = sum(1 for r in self.records if r['status'] == 'ERROR')
+        skipped = sum(1 for r in self.records if r['status'] in ('SKIP', 'DEFERRED'))
+        total_time = sum(r['response_time'] for r in self.records)
+        counts = {
+            'tests': str(len(self.records)),
+            'failures': str(failures),
+            'errors': str(errors),
+            'skipped': str(skipped),
+            'time': f"{total_time:.3f}"
+        }
+
+        suites = ET.Element('testsuites', name='link-checker', **counts)
+        suite = ET.SubElement(suites, 'testsuite', name='links', **counts)
+        for record in self.records:
+            classname = parse_location(record['locations'][0])[0] if record['locations'] else 'links'
+            case = ET.SubElement(suite, 'testcase', classname=classname, name=record['url'],
+                                 time=f"{record['response_time']:.3f}")
+            details = '\n'.join(record['locations'])
+            if record['status'] == 'FAIL':
+                ET.SubElement(case, 'failure', message=record['error_message'] or 'FAIL',
+                              type='FAIL').text = details
+            elif record['status'] == 'ERROR':
+                ET.SubElement(case, 'error', message=record['error_message'] or 'ERROR',
+                              type='ERROR').text = details
+            elif record['status'] in ('SKIP', 'DEFERRED'):
+                ET.SubElement(case, 'skipped', message=record['error_message'] or 'skipped')
+
+        ET.indent(suites)
+        return ET.tostring(suites, encoding='unicode', xml_declaration=True) + '\n'
+
+class SarifSink(DocumentSink):
+    """SARIF 2.1.0 log with one result per failed link, located in the source files."""
+
+    RULES = {
+        'FAIL': ('broken-link', 'Broken link', 'error'),
+        'ERROR': ('link-check-error', 'Link could not be checked', 'warning')
+    }
+
+    def render(self) -> str:
+        results = []
+        for record in self.records:
+            if record['status'] not in self.RULES:
+                continue
+            rule_id, _, level = self.RULES[record['status']]
+            locations = []
+            for location in record['locations']:
+                path, line, column = parse_location(location)
+                locations.append({
+                    'physicalLocation': {
+                        'artifactLocation': {'uri': path},
+                        'region': {'startLine': line, 'startColumn': column}
+                    }
+                })
+            results.append({
+                'ruleId': rule_id,
+                'level': level,
+                'message': {'text': f"{record['url']}: {record['error_message']}"},
+                'locations': locations
+            })
+
+        log = {
+            '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+            'version': '2.1.0',
+            'runs': [{
+                'tool': {
+                    'driver': {
+                        'name': 'OpenShift Workshop Link Checker',
+                        'rules': [
+                            {'id': rule_id, 'shortDescription': {'text': description}}
+                            for rule_id, description, _ in self.RULES.values()
+                        ]
+                    }
+                },
+                'results': results
+            }]
+        }
+        return json.dumps(log, indent=2) + '\n'
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Skip Rule Matcher
+Compiled, host-indexed matching of the config skip_patterns.
+"""
+
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlparse
+
+# A pattern anchored at the start of the URL (``^``) with a scheme followed by a
+# literal host name that ends at a port, path or anchor. Unanchored patterns may
+# match a URL embedded anywhere (e.g. in a redirect query), so they are not indexed.
+HOST_LITERAL = re.compile(r"^\^(?:https\?|https|http)://((?:[A-Za-z0-9-]|\\\.)+)(?=[:/]|\$|/\?\$)")
+
+@dataclass
+class SkipRule:
+    """A single configured skip pattern."""
+    index: int
+    pattern: str
+    reason: str
+    regex: Pattern
+    host: Optional[str] = None
+
+class SkipMatcher:
+    """Match URLs against the skip rules in a single step.
+
+    Rules anchored to a literal host (e.g. ``^https?://localhost:[0-9]+``)
+    are indexed by host name and only evaluated for URLs on that host. All
+    other rules are combined into one anchored alternation of lookaheads with
+    a named group per rule, so a single ``match`` call returns the first rule,
+    in configuration order, that matches anywhere in the URL. Hits are
+    counted per rule so rules that never fire can be pruned.
+    """
+
+    def __init__(self, patterns: List[str], reasons: Optional[Dict[str, str]] = None):
+        reasons = reasons or {}
+        self.rules: List[SkipRule] = []
+        self._host_rules: Dict[str, List[SkipRule]] = {}
+        generic: List[SkipRule] = []
+
+        for index, pattern in enumerate(patterns):
+            rule = SkipRule(
+                index=index,
+                pattern=pattern,
+                reason=reasons.get(pattern, "configured to skip"),
+                regex=re.compile(pattern)
+            )
+            host_match = HOST_LITERAL.match(pattern)
+            if host_match:
+                rule.host = host_match.group(1).replace("\\.", ".").lower()
+                self._host_rules.setdefault(rule.host, []).append(rule)
+            else:
+                generic.append(rule)
+            self.rules.append(rule)
+
+        self._generic = None
+        if generic:
+            alternatives = []
+            for rule in generic:
+                body = rule.pattern[1:] if rule.pattern.startswith("^") else f".*?(?:{rule.pattern})"
+                alternatives.append(f"(?=(?P<r{rule.index}>{body}))")
+            self._generic = re.compile("|".join(alternatives), re.DOTALL)
+
+        self.hits: Counter = Counter()
+        self.evaluated = 0
+        self._lock = threading.Lock()
+
+    def match(self, url: str, count: bool = True) -> Optional[SkipRule]:
+        """Return the first rule (in configuration order) matching the URL, if any.
+
+        Pass ``count=False`` for lookups that should not affect the hit counts.
+        """
+        best: Optional[SkipRule] = None
+
+        if self._generic is not None:
+            generic_match = self._generic.match(url)
+            if generic_match:
+                best = self.rules[int(generic_match.lastgroup[1:])]
+
+        host = (urlparse(url).hostname or "").lower()
+        for rule in self._host_rules.get(host, ()):
+            if best is not None and rule.index > best.index:
+                break
+            if rule.regex.search(url):
+                best = rule
+                break
+
+        if count:
+            with self._lock:
+                self.evaluated += 1
+                if best is not None:
+                    self.hits[best.pattern] += 1
+        return best
+
+    def should_skip(self, url: str) -> Tuple[bool, Optional[str]]:
+        """Return whether the URL should be skipped and the configured reason."""
+        rule = self.match(url)
+        return (True, rule.reason) if rule else (False, None)
+
+    def unused_rules(self) -> List[str]:
+        """Patterns that have not matched any URL so far."""
+        return [rule.pattern for rule in self.rules if self.hits[rule.pattern] == 0]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Analysis Cache Tests
+Runs the AI analysis with the offline stub model against a temporary cache file.
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from intelligent_link_checker import IntelligentLinkChecker
+from link_cache import AnalysisCache
+from link_checker import LinkResult, ModuleResult
+
+def module_result(links):
+    return ModuleResult(module_name="module-01", file_path="content/modules/ROOT/pages/module-01.adoc",
+                        total_links=len(links), passed_links=0, failed_links=len(links), skipped_links=0,
+                        links=links, processing_time=0.1)
+
+class AnalysisCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache_path = str(Path(directory.name) / "links.sqlite")
+
+        self.checker = IntelligentLinkChecker(str(SCRIPTS_DIR / "link-checker-config.json"))
+        self.checker.set_ai_backend("stub")
+        self.checker.set_cache(self.cache_path)
+        self.addCleanup(self.checker.set_cache, None)
+        # No web search: the failures are analyzed without replacements
+        patcher = mock.patch.object(self.checker, "_perform_web_search", return_value="")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.links = [
+            LinkResult("https://docs.example.com/4.18/install", 404, "FAIL", 0.1, "HTTP 404"),
+            LinkResult("https://docs.example.com/4.18/upgrade", None, "FAIL", 0.1, "ConnectionError: refused"),
+        ]
+
+    def analyze(self):
+        with mock.patch.object(self.checker, "_invoke_llm", wraps=self.checker._invoke_llm) as invoke:
+            analysis = self.checker.analyze_failures([module_result(self.links)])
+        return analysis, invoke.call_count
+
+    def test_second_run_reuses_the_analysis(self):
+        first, first_calls = self.analyze()
+        self.assertGreater(first_calls, 0)
+
+        second, second_calls = self.analyze()
+        self.assertEqual(second_calls, 0)
+        self.assertEqual(second.fingerprint, first.fingerprint)
+        self.assertEqual(second.analysis, first.analysis)
+
+    def test_analysis_survives_a_new_checker(self):
+        first, _ = self.analyze()
+        self.checker.set_cache(self.cache_path)  # Reopen, as the next CI run does
+        second, calls = self.analyze()
+        self.assertEqual(calls, 0)
+        self.assertEqual(second.fingerprint, first.fingerprint)
+
+    def test_changed_error_class_changes_the_fingerprint(self):
+        first, _ = self.analyze()
+        self.links[0].status_code = 500
+        second, calls = self.analyze()
+        self.assertNotEqual(second.fingerprint, first.fingerprint)
+        self.assertGreater(calls, 0)
+
+    def test_changed_error_message_keeps_the_fingerprint(self):
+        first, _ = self.analyze()
+        self.links[1].error_message = "ConnectionError: reset by peer"
+        second, calls = self.analyze()
+        self.assertEqual(second.fingerprint, first.fingerprint)
+        self.assertEqual(calls, 0)
+
+    def test_expired_analyses_are_ignored_and_pruned(self):
+        first, _ = self.analyze()
+        self.checker.set_cache(None)
+        cache = AnalysisCache(self.cache_path, ttl=60)
+        self.addCleanup(cache.close)
+        self.assertIsNotNone(cache.get(first.fingerprint))
+        with mock.patch("link_cache.time.time", return_value=time.time() + 120):
+            self.assertIsNone(cache.get(first.fingerprint))
+            AnalysisCache(self.cache_path, ttl=60).close()
+        count = cache._conn.execute("SELECT COUNT(*) FROM ai_analyses").fetchone()[0]
+        self.assertEqual(count, 0)
+
+if __name__ == "__main__":
+    unittest.main()
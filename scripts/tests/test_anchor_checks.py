@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Anchor Check Tests
+Checks fragment links through LinkChecker against a local server serving HTML pages.
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from link_checker import LinkChecker
+
+PAGE = b"<html><body><h2 id=\"install\">Install</h2><h2 id=\"upgrade\">Upgrade</h2></body></html>"
+FILLER = b"<p>" + b"x" * 16384 + b"</p>\n"
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves PAGE, throttles while 429s remain, and trickles /slow out over several seconds."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.server.requests.append(("HEAD", self.path))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path))
+        if self.server.throttled > 0:
+            self.server.throttled -= 1
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        if self.path != "/slow":
+            self.send_header("Content-Length", str(len(PAGE)))
+            self.end_headers()
+            self.wfile.write(PAGE)
+            return
+        chunks = [FILLER] * 10 + [PAGE]
+        self.send_header("Content-Length", str(sum(len(chunk) for chunk in chunks)))
+        self.end_headers()
+        try:
+            for chunk in chunks:
+                self.wfile.write(chunk)
+                self.wfile.flush()
+                time.sleep(0.5)
+        except OSError:
+            pass  # The checker stopped reading
+
+class PageServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), PageHandler)
+        self.requests: List[tuple] = []
+        self.throttled = 0  # Number of 429s to answer first
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+class AnchorCheckTest(unittest.TestCase):
+    def setUp(self):
+        self.server = PageServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        with open(SCRIPTS_DIR / "link-checker-config.json", "r") as f:
+            config: Dict = json.load(f)
+        config["cache"]["enabled"] = False
+        config["skip_patterns"], config["skip_reasons"] = [], {}  # The shipped rules skip 127.0.0.1
+        config["output"]["log_file"] = str(Path(directory.name) / "link-check.log")
+        config["rate_limit"] = {"requests_per_second": 50, "burst": 50}
+        config["retry"]["delay"] = 0.01
+        config_file = Path(directory.name) / "config.json"
+        config_file.write_text(json.dumps(config))
+        self.checker = LinkChecker(str(config_file))
+
+    def check(self, *paths: str, deadline=None):
+        urls = [self.server.url(path) for path in paths]
+        self.checker.anchor_index.plan(urls)
+        return [self.checker.check_url(url, deadline) for url in urls]
+
+    def test_fragment_link_is_checked_with_one_request(self):
+        result, = self.check("/page#install")
+        self.assertEqual(result.status, "PASS")
+        self.assertEqual(result.method, "GET")
+        self.assertEqual(self.server.requests, [("GET", "/page")])
+
+    def test_missing_anchor_fails(self):
+        result, = self.check("/page#removed")
+        self.assertEqual(result.status, "FAIL")
+        self.assertEqual(result.error_message, "Anchor #removed not found")
+        self.assertEqual(self.server.requests, [("GET", "/page")])
+
+    def test_fragments_of_one_page_share_the_download(self):
+        results = self.check("/page#install", "/page#upgrade", "/page#removed")
+        self.assertEqual([result.status for result in results], ["PASS", "PASS", "FAIL"])
+        self.assertEqual(self.checker.anchor_index.pages_fetched, 1)
+        self.assertNotIn("HEAD", [method for method, _ in self.server.requests])
+
+    def test_links_without_fragment_are_probed(self):
+        result, = self.check("/page")
+        self.assertEqual(result.status, "PASS")
+        self.assertEqual(self.server.requests, [("HEAD", "/page")])
+
+    def test_throttled_page_download_is_retried(self):
+        self.server.throttled = 1
+        result, = self.check("/page#install")
+        self.assertEqual(result.status, "PASS")
+        self.assertEqual(result.timing.retries, 1)
+        self.assertEqual(self.server.requests, [("GET", "/page"), ("GET", "/page")])
+
+    def test_page_download_stops_at_the_deadline(self):
+        start = time.monotonic()
+        result, = self.check("/slow#install", deadline=start + 1.5)
+        self.assertLess(time.monotonic() - start, 3)
+        # The anchor could not be looked up in time, so the HTTP verdict stands
+        self.assertEqual(result.status, "PASS")
+
+if __name__ == "__main__":
+    unittest.main()
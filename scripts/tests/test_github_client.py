@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - GitHub Client Tests
+Exercises GitHubClient against a local mock of the GitHub REST API.
+"""
+
+import json
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from github_client import GitHubClient, GitHubError
+
+REPO = "example/workshop"
+MARKER = "<!-- link-checker-report -->"
+
+class MockGitHubHandler(BaseHTTPRequestHandler):
+    """Serves the few issue endpoints GitHubClient uses from the server's state."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in self.server.rate_limit.items():
+            self.send_header(f"X-RateLimit-{key.capitalize()}", str(value))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str) -> None:
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length)) if length else None
+        self.server.requests.append((method, url.path, payload))
+
+        failures = self.server.failures.get(method)
+        if failures:
+            self.server.failures[method] -= 1
+            self._send(502, {"message": "Bad Gateway"})
+            return
+
+        issues_path = f"/repos/{REPO}/issues"
+        if method == "GET" and url.path == issues_path:
+            label = query.get("labels")
+            self._send(200, [issue for issue in self.server.issues
+                             if issue["state"] == "open" and label in issue["labels"]])
+        elif method == "GET" and url.path == "/search/issues":
+            text = query["q"].split('"')[1]
+            self._send(200, {"items": [issue for issue in self.server.issues
+                                       if issue["state"] == "open" and text in issue["body"]]})
+        elif method == "POST" and url.path == issues_path:
+            issue = dict(payload, number=len(self.server.issues) + 1, state="open")
+            self.server.issues.append(issue)
+            self._send(201, issue)
+        elif method == "PATCH" and url.path.startswith(issues_path + "/"):
+            issue = self.server.issues[int(url.path.rsplit("/", 1)[1]) - 1]
+            issue.update(payload)
+            self._send(200, issue)
+        else:
+            self._send(404, {"message": "Not Found"})
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+class MockGitHubServer(ThreadingHTTPServer):
+    """Mock API holding issues, the requests received and the rate limit headers to send."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), MockGitHubHandler)
+        self.issues: List[Dict] = []
+        self.requests: List[tuple] = []
+        self.rate_limit: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}  # Method -> number of 502s to answer first
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def add_issue(self, body: str, labels: List[str], title: str = "Link check") -> Dict:
+        issue = {"number": len(self.issues) + 1, "title": title, "body": body,
+                 "labels": labels, "state": "open"}
+        self.issues.append(issue)
+        return issue
+
+    def methods(self) -> List[str]:
+        return [method for method, _, _ in self.requests]
+
+class GitHubClientTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockGitHubServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.client = GitHubClient("token", REPO, api_url=self.server.url, timeout=5)
+
+    def upsert(self, body: str, fingerprint: Optional[str] = None):
+        return self.client.upsert_issue("Link check", body, ["link-checker", "bug"], MARKER, fingerprint)
+
+    def test_find_open_issue_by_label_prefers_marker(self):
+        self.server.add_issue("unrelated", ["link-checker"])
+        marked = self.server.add_issue(f"{MARKER} report", ["link-checker"])
+        self.assertEqual(self.client.find_open_issue("link-checker", MARKER)["number"], marked["number"])
+        self.assertNotIn("/search/issues", [path for _, path, _ in self.server.requests])
+
+    def test_find_open_issue_falls_back_to_marker_search(self):
+        issue = self.server.add_issue(f"{MARKER} report", ["bug"])  # Label removed by hand
+        found = self.client.find_open_issue("link-checker", MARKER)
+        self.assertEqual(found["number"], issue["number"])
+        self.assertEqual(self.server.requests[-1][1], "/search/issues")
+
+    def test_find_open_issue_none(self):
+        self.assertIsNone(self.client.find_open_issue("link-checker", MARKER))
+
+    def test_upsert_creates_issue(self):
+        issue, outcome = self.upsert(f"{MARKER} first")
+        self.assertEqual(outcome, "created")
+        self.assertEqual(issue["labels"], ["link-checker", "bug"])
+        self.assertEqual(len(self.server.issues), 1)
+
+    def test_upsert_updates_issue_in_place(self):
+        self.server.add_issue(f"{MARKER} fingerprint:old", ["link-checker"])
+        issue, outcome = self.upsert(f"{MARKER} fingerprint:new", "fingerprint:new")
+        self.assertEqual(outcome, "updated")
+        self.assertEqual(issue["number"], 1)
+        self.assertEqual(self.server.issues[0]["body"], f"{MARKER} fingerprint:new")
+        self.assertEqual(len(self.server.issues), 1)
+
+    def test_upsert_leaves_unchanged_issue_alone(self):
+        self.server.add_issue(f"{MARKER} fingerprint:same", ["link-checker"])
+        issue, outcome = self.upsert(f"{MARKER} fingerprint:same", "fingerprint:same")
+        self.assertEqual(outcome, "unchanged")
+        self.assertEqual(self.server.methods(), ["GET"])
+
+    def test_rate_limit_waits_for_reset(self):
+        self.server.add_issue(MARKER, ["link-checker"])
+        reset = int(time.time()) + 30
+        self.server.rate_limit = {"limit": 5000, "remaining": 0, "reset": reset, "used": 5000}
+        self.client.find_open_issue("link-checker", MARKER)
+        self.assertEqual(self.client.rate_limit["remaining"], 0)
+        self.assertEqual(self.client.rate_limit["reset"], reset)
+
+        with mock.patch("github_client.time.sleep") as sleep:
+            self.client.find_open_issue("link-checker", MARKER)
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args[0][0], 30, delta=2)
+
+    def test_rate_limit_too_far_away_fails(self):
+        self.server.add_issue(MARKER, ["link-checker"])
+        self.server.rate_limit = {"remaining": 0, "reset": int(time.time()) + 3600}
+        self.client.find_open_issue("link-checker", MARKER)
+        with mock.patch("github_client.time.sleep") as sleep:
+            with self.assertRaises(GitHubError):
+                self.client.find_open_issue("link-checker", MARKER)
+        sleep.assert_not_called()
+
+    def test_create_is_not_retried(self):
+        self.server.failures["POST"] = 1
+        with self.assertRaises(GitHubError):
+            self.upsert(f"{MARKER} first")
+        self.assertEqual(self.server.methods().count("POST"), 1)
+
+    def test_reads_and_edits_are_retried(self):
+        self.server.add_issue(f"{MARKER} fingerprint:old", ["link-checker"])
+        self.server.failures = {"GET": 1, "PATCH": 1}
+        with mock.patch("urllib3.util.retry.Retry.sleep"):
+            _, outcome = self.upsert(f"{MARKER} fingerprint:new", "fingerprint:new")
+        self.assertEqual(outcome, "updated")
+        self.assertEqual(self.server.methods(), ["GET", "GET", "PATCH", "PATCH"])
+
+if __name__ == "__main__":
+    unittest.main()
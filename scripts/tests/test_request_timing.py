@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Request Timing Tests
+Checks the per-attempt timing of the instrumented connections against a local server.
+"""
+
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+from urllib3.util.retry import Retry
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from request_timing import TimingHTTPAdapter, measure
+
+DELAY = 0.1
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Answers every request after DELAY seconds, with 502 while failures remain."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(DELAY)
+        failing = self.server.failures > 0
+        self.server.failures -= 1
+        body = b"<html>ok</html>"
+        self.send_response(502 if failing else 200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class RequestTimingTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        self.server.daemon_threads = True
+        self.server.failures = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/page"
+
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502], allowed_methods=None)
+        self.session.mount("http://", TimingHTTPAdapter(max_retries=retry))
+        self.addCleanup(self.session.close)
+
+    def get(self):
+        start = time.perf_counter()
+        with measure() as timing:
+            response = self.session.get(self.url, timeout=5)
+            timing.record_response(response)
+        return timing, time.perf_counter() - start
+
+    def test_phases_of_a_single_request(self):
+        timing, elapsed = self.get()
+        self.assertEqual(timing.retries, 0)
+        self.assertGreater(timing.connect, 0)
+        self.assertGreaterEqual(timing.ttfb, DELAY)
+        self.assertLessEqual(timing.network, elapsed)
+        self.assertGreater(timing.approx_bytes, 0)
+
+    def test_backoff_between_retries_is_not_ttfb(self):
+        self.server.failures = 2  # Second retry sleeps backoff_factor * 2 = 1 second
+        timing, elapsed = self.get()
+        self.assertEqual(timing.retries, 2)
+        self.assertGreaterEqual(timing.ttfb, 3 * DELAY)
+        self.assertGreaterEqual(elapsed - timing.network, 0.9)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Skip Rule Tests
+Checks the host index of SkipMatcher against the shipped configuration.
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from skip_rules import SkipMatcher
+
+class SkipMatcherTest(unittest.TestCase):
+    def setUp(self):
+        with open(SCRIPTS_DIR / "link-checker-config.json", "r") as f:
+            config = json.load(f)
+        self.matcher = SkipMatcher(config["skip_patterns"], config["skip_reasons"])
+
+    def test_shipped_config_fills_host_index(self):
+        hosts = {rule.host for rule in self.matcher.rules if rule.host}
+        self.assertTrue({"localhost", "127.0.0.1", "console.redhat.com", "mirror.openshift.com"} <= hosts)
+
+    def test_indexed_rules_match_their_host(self):
+        rule = self.matcher.match("http://localhost:8080/api", count=False)
+        self.assertEqual(rule.host, "localhost")
+        self.assertEqual(self.matcher.match("http://127.0.0.1:9000", count=False).host, "127.0.0.1")
+
+    def test_indexed_rules_do_not_match_embedded_urls(self):
+        self.assertIsNone(self.matcher.match("https://redirect.io/?u=http://localhost:8080", count=False))
+
+    def test_generic_rules_still_match(self):
+        rule = self.matcher.match("https://app.example.com/login", count=False)
+        self.assertIsNotNone(rule)
+        self.assertIsNone(rule.host)
+
+    def test_first_rule_in_configuration_order_wins(self):
+        matcher = SkipMatcher(["^https?://localhost:[0-9]+", "localhost"], {"localhost": "generic"})
+        self.assertEqual(matcher.match("http://localhost:80/", count=False).index, 0)
+        self.assertEqual(matcher.match("http://localhost/", count=False).index, 1)
+
+    def test_unanchored_patterns_are_not_indexed(self):
+        matcher = SkipMatcher(["https?://localhost:[0-9]+"])
+        self.assertIsNone(matcher.rules[0].host)
+        self.assertIsNotNone(matcher.match("https://redirect.io/?u=http://localhost:8080", count=False))
+
+if __name__ == "__main__":
+    unittest.main()
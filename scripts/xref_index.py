@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+OpenShift Bare Metal Workshop - Cross-Reference Index
+Offline index of Antora pages and anchors for resolving xref:, <<anchor>> and
+include:: references without any network access.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from asciidoc_attributes import AttributeResolver, expand_value
+from content_discovery import load_component_descriptor
+
+# Block and inline anchors: [[id]], [[id,reftext]], [[[bibid]]], anchor:id[], [#id.role]
+ID = r"[A-Za-z_:][\w:.-]*"
+INLINE_ANCHOR = re.compile(rf"\[\[\[?({ID})(?:,[^\]]*)?\]\]\]?|anchor:({ID})\[")
+BLOCK_ATTRIBUTES = re.compile(rf"^\[[\w-]*#({ID})[^\]]*\]\s*$|^\[.*\bid=[\"']?({ID})")
+SECTION_TITLE = re.compile(r"^(={2,6})\s+(\S.*?)\s*$")
+TRAILING_ANCHOR = re.compile(rf"\s*\[\[({ID})(?:,[^\]]*)?\]\]$")
+# Content of these delimited blocks is not parsed for references (``----`` listing, ``....``
+# literal, ``////`` comment, ``++++`` passthrough and Markdown-style fences)
+VERBATIM_DELIMITER = re.compile(r"^(-{4,}|\.{4,}|/{4,}|\+{4,}|`{3})(?:\w[\w+-]*)?\s*$")
+
+XREF = re.compile(r"xref:([^\s\[]+)\[")
+SHORT_XREF = re.compile(r"<<([^\s,<>][^,<>]*?)(?:,[^<>]*)?>>")
+INCLUDE = re.compile(r"^include::([^\[]+)\[")
+
+# Characters Asciidoctor drops when generating a section ID from its title
+INVALID_ID_CHARS = re.compile(r"<[^>]+>|&(?:[a-z][a-z]+\d{0,2}|#\d\d\d{0,4}|#x[\da-f][\da-f][\da-f]{0,3});|[^ \w.-]+")
+
+# Antora resource families and the folder they live in within a module
+FAMILY_FOLDERS = {
+    'page': 'pages',
+    'partial': 'partials',
+    'example': 'examples',
+    'image': 'images',
+    'attachment': 'attachments'
+}
+
+@dataclass
+class InternalReference:
+    """A reference to another page, anchor or file of the documentation."""
+    kind: str  # 'xref', 'anchor' (<<id>>) or 'include'
+    text: str  # The reference as written, e.g. "xref:module-02-infrastructure.adoc#setup"
+    target: str
+    file_path: str
+    line: int
+    column: int
+
+    @property
+    def location(self) -> str:
+        """Location in ``path:line:column`` form."""
+        return f"{self.file_path}:{self.line}:{self.column}"
+
+@dataclass
+class AntoraComponent:
+    """An Antora component: its name, root directory and indexed pages."""
+    name: str
+    root: Path
+    pages: Dict[Tuple[str, str], Path] = field(default_factory=dict)  # (module, page path) -> file
+
+def section_id(title: str, prefix: str = '_', separator: str = '_') -> str:
+    """ID Asciidoctor generates for a section title (default ``idprefix``/``idseparator``)."""
+    generated = INVALID_ID_CHARS.sub('', title.lower())
+    if separator:
+        generated = re.sub(r"[ .-]+", separator, generated).rstrip(separator)
+        if not prefix and generated.startswith(separator):
+            generated = generated[len(separator):]
+    return prefix + generated
+
+def scan_document(text: str, file_path: str = "") -> Tuple[Set[str], List[InternalReference]]:
+    """Collect the anchors a document defines and the references it makes, in one pass.
+
+    Verbatim blocks are skipped, so shell heredocs such as ``<<EOF`` and
+    sample markup in listings are not mistaken for references. Include
+    directives are preprocessor lines and are honoured everywhere.
+    """
+    anchors: Set[str] = set()
+    references: List[InternalReference] = []
+    generated: Dict[str, int] = {}
+    verbatim: Optional[str] = None
+    pending_id = False  # A block anchor line already named the next section
+
+    for number, line in enumerate(text.splitlines(), start=1):
+        include = INCLUDE.match(line)
+        if include:
+            references.append(InternalReference('include', line[:include.end() - 1], include.group(1),
+                                                file_path, number, 1))
+            continue
+
+        delimiter = VERBATIM_DELIMITER.match(line)
+        if verbatim:
+            if delimiter and delimiter.group(1) == verbatim:
+                verbatim = None
+            continue
+        if delimiter:
+            verbatim = delimiter.group(1)
+            pending_id = False
+            continue
+        if line.startswith('//'):
+            continue
+
+        block = BLOCK_ATTRIBUTES.match(line)
+        if block:
+            anchors.add(block.group(1) or block.group(2))
+            pending_id = True
+            continue
+
+        title = SECTION_TITLE.match(line)
+        if title:
+            trailing = TRAILING_ANCHOR.search(title.group(2))
+            if trailing:
+                anchors.add(trailing.group(1))
+            elif not pending_id:
+                base = section_id(title.group(2))
+                count = generated.get(base, 0) + 1
+                generated[base] = count
+                anchors.add(base if count == 1 else f"{base}_{count}")
+            pending_id = False
+        elif line.strip():
+            # A line holding only [[id]] names the block below it, like [#id]
+            pending_id = bool(INLINE_ANCHOR.fullmatch(line.strip()))
+
+        for match in INLINE_ANCHOR.finditer(line):
+            anchors.add(match.group(1) or match.group(2))
+        for match in XREF.finditer(line):
+            references.append(InternalReference('xref', match.group(0)[:-1], match.group(1),
+                                                file_path, number, match.start() + 1))
+        for match in SHORT_XREF.finditer(line):
+            references.append(InternalReference('anchor', match.group(0), match.group(1).strip(),
+                                                file_path, number, match.start() + 1))
+    return anchors, references
+
+class ContentIndex:
+    """Pages and anchors of the Antora components, for resolving internal references.
+
+    Every page of every component is read and scanned once when the index
+    is built; documents outside a component (such as the top-level README)
+    are scanned on first use. Resolving a reference afterwards is a
+    dictionary lookup.
+    """
+
+    def __init__(self, descriptors: List[str], attributes: Optional[AttributeResolver] = None):
+        self.components: List[AntoraComponent] = []
+        self.attributes = attributes
+        self._anchors: Dict[Path, Set[str]] = {}
+        self._references: Dict[Path, List[InternalReference]] = {}
+        self._page_attributes: Dict[Path, Dict[str, str]] = {}
+        for descriptor in descriptors:
+            path = Path(descriptor)
+            if path.is_file():
+                self.components.append(self._index_component(path))
+
+    def _index_component(self, descriptor: Path) -> AntoraComponent:
+        """Scan every page of a component."""
+        name = str(load_component_descriptor(str(descriptor)).get('name') or descriptor.parent.name)
+        component = AntoraComponent(name, descriptor.parent.resolve())
+        for pages_dir in sorted((component.root / 'modules').glob('*/pages')):
+            module = pages_dir.parent.name
+            for page in sorted(pages_dir.rglob('*.adoc')):
+                component.pages[(module, page.relative_to(pages_dir).as_posix())] = page
+                self._scan(page)
+        return component
+
+    @property
+    def page_count(self) -> int:
+        return sum(len(component.pages) for component in self.components)
+
+    @property
+    def anchor_count(self) -> int:
+        return sum(len(anchors) for anchors in self._anchors.values())
+
+    def _scan(self, path: Path) -> None:
+        anchors, references = scan_document(path.read_text(encoding='utf-8'), str(path))
+        self._anchors[path] = anchors
+        self._references[path] = references
+
+    def _anchors_of(self, path: Path) -> Set[str]:
+        path = path.resolve()
+        if path not in self._anchors:
+            self._scan(path)
+        return self._anchors[path]
+
+    def references(self, file_path: str) -> List[InternalReference]:
+        """Internal references made by a file, reported with ``file_path`` as given."""
+        path = Path(file_path).resolve()
+        if path not in self._references:
+            self._scan(path)
+        return [InternalReference(ref.kind, ref.text, ref.target, file_path, ref.line, ref.column)
+                for ref in self._references[path]]
+
+    def _locate(self, path: Path) -> Tuple[Optional[AntoraComponent], Optional[str], Optional[Path]]:
+        """Return the component, module and family folder a file belongs to."""
+        for component in self.components:
+            try:
+                parts = path.relative_to(component.root / 'modules').parts
+            except ValueError:
+                continue
+            if len(parts) >= 2:
+                module = parts[0]
+                family_dir = component.root / 'modules' / module / parts[1] if len(parts) > 2 else None
+                return component, module, family_dir
+        return None, None, None
+
+    def resolve(self, ref: InternalReference) -> Tuple[str, Optional[str]]:
+        """Resolve a reference, returning ('PASS'|'FAIL'|'SKIP', reason)."""
+        source = Path(ref.file_path).resolve()
+        reference = ref.target
+        if '{' in reference and self.attributes:
+            if source not in self._page_attributes:
+                self._page_attributes[source] = self.attributes.page_attributes(
+                    source.read_text(encoding='utf-8'), str(source))
+            reference = expand_value(reference, self._page_attributes[source])
+        if '{' in reference:
+            return 'SKIP', "target uses undefined document attributes"
+        if ref.kind == 'include':
+            return self._resolve_include(reference, source)
+
+        target, _, fragment = reference.partition('#')
+        if ref.kind == 'anchor' and not fragment and not target.endswith('.adoc'):
+            target, fragment = '', target
+        elif ref.kind == 'xref' and not fragment and not target.endswith('.adoc'):
+            # Asciidoctor's xref:id[] form refers to an ID in the same document
+            target, fragment = '', target
+
+        if not target:
+            page = source
+        else:
+            page, status, reason = self._resolve_page(target, source)
+            if page is None:
+                return status, reason
+        if fragment and fragment not in self._anchors_of(page):
+            where = f" in {target}" if target else ""
+            return 'FAIL', f"Anchor #{fragment} not found{where}"
+        return 'PASS', None
+
+    def _resolve_page(self, target: str, source: Path) -> Tuple[Optional[Path], str, Optional[str]]:
+        """Find the file of an xref page target such as ``[component:][module:]page.adoc``.
+
+        Returns the page, or None with the status and reason to report.
+        """
+        if not target.endswith('.adoc'):
+            target += '.adoc'
+        component, module, family_dir = self._locate(source)
+        if component is None:
+            # Plain Asciidoctor inter-document reference, relative to the document
+            page = (source.parent / target).resolve()
+            return (page, 'PASS', None) if page.is_file() else (None, 'FAIL', f"Page {target} not found")
+
+        if '@' in target:
+            return None, 'SKIP', f"page in another component version ({target})"
+        coordinates = target.split(':')
+        page_path = coordinates[-1]
+        if page_path.startswith('page$'):
+            page_path = page_path[len('page$'):]
+        if len(coordinates) > 2 and coordinates[-3] != component.name:
+            return None, 'SKIP', f"page in another component ({coordinates[-3]})"
+        if len(coordinates) > 1:
+            module = coordinates[-2] or 'ROOT'
+        elif page_path.startswith(('./', '../')) and family_dir is not None:
+            # Relative to the referencing page's folder within the module
+            page_path = os.path.normpath(os.path.relpath(source.parent / page_path, family_dir)).replace(os.sep, '/')
+        page = component.pages.get((module, page_path))
+        if page is None:
+            return None, 'FAIL', f"Page {target} not found in component {component.name}"
+        return page, 'PASS', None
+
+    def _resolve_include(self, target: str, source: Path) -> Tuple[str, Optional[str]]:
+        """Check that a local include target exists."""
+        if re.match(r"^https?://", target):
+            return 'SKIP', "remote include"
+        component, module, _ = self._locate(source)
+        family = re.match(r"^(?:(?:([\w-]+):)?([\w-]*):)?(\w+)\$(.+)$", target)
+        if family and component is not None:
+            other_component, other_module, kind, path = family.groups()
+            if other_component and other_component != component.name:
+                return 'SKIP', f"resource in another component ({other_component})"
+            if kind not in FAMILY_FOLDERS:
+                return 'FAIL', f"Unknown resource family {kind}$"
+            resolved = component.root / 'modules' / (other_module or module) / FAMILY_FOLDERS[kind] / path
+        else:
+            resolved = source.parent / target
+        if resolved.is_file():
+            return 'PASS', None
+        return 'FAIL', f"Included file {target} not found"